@@ -8,7 +8,6 @@ This is the main entry point for the application.
 import wx
 
 from src.logging_setup import setup_logging
-from src.gui import MainWindow
 from src.config import get_user_data_dir
 
 
@@ -16,6 +15,9 @@ def main():
     """Main entry point for the application."""
     # Set up logging
     logger = setup_logging()
+
+    # Imported here so logging is configured before the GUI module graph loads
+    from src.gui import MainWindow
     logger.info("Application starting")
 
     # Log user data directory location
@@ -1,11 +1,17 @@
 """Configuration settings and constants for the Sim-CPDLC application."""
 
+import functools
 import os
 import json
 import logging
 import tempfile
 import appdirs
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Application information
 APP_NAME = "Sim-CPDLC"
 APP_AUTHOR = "Sim-CPDLC"
@@ -16,8 +22,13 @@ APP_VERSION = "0.1.0"
 
 
 # Get user data directory
+@functools.lru_cache(maxsize=1)
 def get_user_data_dir():
-    """Get the OS-specific user data directory for this application."""
+    """Get the OS-specific user data directory for this application.
+
+    Cached so the appdirs lookup and makedirs syscall run at most once
+    per process.
+    """
     data_dir = appdirs.user_data_dir(APP_NAME, APP_AUTHOR)
     # Ensure directory exists
     os.makedirs(data_dir, exist_ok=True)
@@ -37,36 +48,73 @@ DEFAULT_CONFIG = {
 }
 
 
+# Cached parsed configuration, updated by save_config so repeated
+# load_config calls (e.g. every ConnectDialog open) skip disk and parsing.
+# The file mtime recorded alongside it lets load_config notice external
+# edits with a single stat instead of a full re-parse.
+_cached_config = None
+_cached_config_mtime = None
+
+
 def load_config():
     """Load application configuration from file or return defaults."""
+    global _cached_config, _cached_config_mtime
     logger = logging.getLogger("Sim-CPDLC")
 
-    if not os.path.exists(CONFIG_FILE):
-        logger.info(f"Config file not found at {CONFIG_FILE}, using defaults")
-        return DEFAULT_CONFIG.copy()
+    if _cached_config is not None:
+        try:
+            mtime = os.stat(CONFIG_FILE).st_mtime
+        except OSError:
+            mtime = None
+        if mtime == _cached_config_mtime:
+            return dict(_cached_config)
 
     try:
-        with open(CONFIG_FILE, "r") as f:
-            config = json.load(f)
-            logger.debug(f"Loaded config: {config}")
-
-            # Validate required fields exist, add any missing ones
-            for key, default_value in DEFAULT_CONFIG.items():
-                if key not in config:
-                    logger.warning(f"Missing config key '{key}', using default value")
-                    config[key] = default_value
-
-            return config
-    except json.JSONDecodeError as e:
-        logger.error(f"Invalid JSON in config file: {e}")
+        # Read the whole file with raw os calls: one open, one read, one
+        # close, no Python-level buffering layers for a ~100-byte file
+        fd = os.open(CONFIG_FILE, os.O_RDONLY)
+        try:
+            stat = os.fstat(fd)
+            raw = os.read(fd, stat.st_size)
+        finally:
+            os.close(fd)
+        # orjson parses noticeably faster than the stdlib; fall back if missing
+        config = orjson.loads(raw) if orjson else json.loads(raw)
+        logger.debug("Loaded config: %s", config)
+
+        # Fill in any missing keys with defaults in a single dict merge
+        merged = {**DEFAULT_CONFIG, **config}
+        if len(merged) != len(config):
+            logger.warning("Missing config keys, using default values")
+
+        _cached_config = dict(merged)
+        _cached_config_mtime = stat.st_mtime
+        return merged
+    except FileNotFoundError:
+        logger.info("Config file not found at %s, using defaults", CONFIG_FILE)
+        return DEFAULT_CONFIG.copy()
+    except ValueError as e:
+        logger.error("Invalid JSON in config file: %s", e)
         return DEFAULT_CONFIG.copy()
     except IOError as e:
-        logger.error(f"Error reading config file: {e}")
+        logger.error("Error reading config file: %s", e)
         return DEFAULT_CONFIG.copy()
 
 
+def invalidate_config_cache():
+    """Drop the cached configuration so the next load re-reads the file.
+
+    Only needed when config.json is modified outside save_config, which
+    keeps the cache coherent on its own.
+    """
+    global _cached_config, _cached_config_mtime
+    _cached_config = None
+    _cached_config_mtime = None
+
+
 def save_config(config):
     """Save configuration to file and return success status."""
+    global _cached_config, _cached_config_mtime
     logger = logging.getLogger("Sim-CPDLC")
 
     # Validate config is a dictionary
@@ -78,16 +126,29 @@ def save_config(config):
         config_dir = os.path.dirname(CONFIG_FILE)
         fd, tmp_path = tempfile.mkstemp(dir=config_dir, suffix=".tmp")
         try:
-            with os.fdopen(fd, "w") as f:
-                json.dump(config, f, indent=2)
+            if orjson:
+                data = orjson.dumps(config, option=orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(config, indent=2).encode("utf-8")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+                f.flush()
+                # Make sure the bytes hit disk before the rename so a
+                # crash can never leave a truncated config behind
+                os.fsync(f.fileno())
             os.replace(tmp_path, CONFIG_FILE)
-            logger.debug(f"Saved config: {config}")
+            logger.debug("Saved config: %s", config)
         except BaseException:
             os.unlink(tmp_path)
             raise
+        _cached_config = dict(config)
+        try:
+            _cached_config_mtime = os.stat(CONFIG_FILE).st_mtime
+        except OSError:
+            _cached_config_mtime = None
         return True
     except IOError as e:
-        logger.error(f"Error writing config file: {e}")
+        logger.error("Error writing config file: %s", e)
         return False
 
 
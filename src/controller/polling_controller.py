@@ -8,10 +8,58 @@ from hoppie_connector import HoppieMessage, CpdlcMessage, TelexMessage
 from src.model.connection_manager import ConnectionManager
 from src.utils.message_formatting import extract_message_content
 
+# Plain acknowledgement responses that should not trigger faster polling.
+# Built once so the per-message membership test is a single hashed lookup.
+_ACK_RESPONSES = frozenset(
+    {"WILCO", "UNABLE", "ROGER", "AFFIRM", "NEGATIVE", "YES", "NO"}
+)
+
+def _cpdlc_increases_polling(message):
+    """Return True unless the CPDLC message is a plain acknowledgement."""
+    content = message.get_packet_content()
+    if content:
+        clean_content = extract_message_content(content)
+
+        # If the message only contains an acknowledgement, don't increase polling
+        if clean_content in _ACK_RESPONSES:
+            return False
+    return True
+
+
+# Per-type polling predicates keyed on the exact message class, so the
+# per-message decision is a single dict lookup instead of an isinstance chain
+_POLL_RATE_DISPATCH = {
+    TelexMessage: lambda message: False,
+    CpdlcMessage: _cpdlc_increases_polling,
+}
+
+# Granularity of the single long-running timer. The actual poll cadence is
+# controlled by a monotonic deadline, so interval changes never have to
+# stop and restart the OS timer.
+_TICK_INTERVAL_MS = 1000
+
 
 class PollingController:
     """Controls polling behavior for CPDLC communications."""
 
+    # Fixed attribute layout: no per-instance __dict__, faster attribute
+    # access in the timer hot path
+    __slots__ = (
+        "logger",
+        "connection_manager",
+        "message_callback",
+        "default_poll_interval",
+        "active_poll_interval",
+        "inactivity_timeout",
+        "_inactivity_timeout_s",
+        "last_activity_time",
+        "poll_timer",
+        "_current_interval_ms",
+        "_next_poll_deadline",
+        "_consecutive_empty",
+        "_poll_in_flight",
+    )
+
     def __init__(
         self,
         logger,
@@ -26,7 +74,8 @@ class PollingController:
         Args:
             logger: Application logger
             connection_manager: Connection manager instance
-            message_callback: Callback for received messages
+            message_callback: Callback invoked with the list of messages
+                received in one poll
             default_poll_interval: Default polling interval in milliseconds
             active_poll_interval: Active polling interval in milliseconds
             inactivity_timeout: Inactivity timeout in milliseconds
@@ -37,8 +86,15 @@ class PollingController:
         self.default_poll_interval = default_poll_interval
         self.active_poll_interval = active_poll_interval
         self.inactivity_timeout = inactivity_timeout
+        # Pre-converted once so the per-tick timeout check compares in
+        # seconds without multiplying
+        self._inactivity_timeout_s = inactivity_timeout / 1000.0
         self.last_activity_time = 0
         self.poll_timer = None
+        self._current_interval_ms = default_poll_interval
+        self._next_poll_deadline = 0.0
+        self._consecutive_empty = 0
+        self._poll_in_flight = False
 
     def start(self, parent_window):
         """Start the polling timer.
@@ -48,9 +104,13 @@ class PollingController:
         """
         self.poll_timer = wx.Timer(parent_window)
         parent_window.Bind(wx.EVT_TIMER, self.on_poll_timer, self.poll_timer)
-        self.poll_timer.Start(self.default_poll_interval)
+        self._current_interval_ms = self.default_poll_interval
+        self._next_poll_deadline = (
+            time.monotonic() + self._current_interval_ms / 1000.0
+        )
+        self.poll_timer.Start(_TICK_INTERVAL_MS)
         self.logger.info(
-            f"Started polling timer with interval {self.default_poll_interval}ms"
+            "Started polling timer with interval %sms", self.default_poll_interval
         )
 
     def stop(self):
@@ -74,29 +134,60 @@ class PollingController:
             self.stop()
             return
 
-        try:
-            messages, poll_status = self.connection_manager.poll()
-        except Exception as e:
-            self.logger.error(f"Unexpected error during poll: {e}")
+        # The timer ticks at a fixed granularity; only poll once the
+        # deadline for the current interval has passed, and never start a
+        # new poll while one is still on the wire.
+        if self._poll_in_flight or time.monotonic() < self._next_poll_deadline:
             return
 
-        # Process received messages
+        self._poll_in_flight = True
+        self.connection_manager.poll_async(self._on_poll_done)
+
+    def _on_poll_done(self, result):
+        """Process a completed poll on the main thread."""
+        self._poll_in_flight = False
+        if not self.poll_timer:
+            return
+
+        messages, _poll_status = result
+
+        # Process received messages. The callback gets the whole batch in
+        # one call so the view can refresh once per poll instead of once
+        # per message.
         if messages:
-            self.logger.info(f"Received {len(messages)} new message(s)")
-            for message in messages:
-                self.logger.info(f"Received message: {message}")
-                if self.message_callback:
-                    self.message_callback(message)
+            self._consecutive_empty = 0
+            self.logger.info("Received %d new message(s)", len(messages))
+            if self.message_callback:
+                self.message_callback(messages)
 
-                # Check if this message should trigger faster polling
+            # Check if any message in the batch should trigger faster polling
+            for message in messages:
                 if self.should_increase_polling_rate(message):
                     self.set_active_polling()
+                    break
+        else:
+            # Nothing arrived: when polling at the active rate, back off
+            # exponentially toward the default instead of hammering the
+            # server for the full inactivity window
+            self._consecutive_empty += 1
+            if self._current_interval_ms < self.default_poll_interval:
+                self._current_interval_ms = min(
+                    self.default_poll_interval,
+                    self.active_poll_interval * 2**self._consecutive_empty,
+                )
 
-        # Check if we should return to default polling after inactivity
-        self.check_polling_timeout()
+        # Check if we should return to default polling after inactivity.
+        # Skipped entirely in the steady state where we already poll at
+        # the default interval.
+        if self._current_interval_ms != self.default_poll_interval:
+            self.check_polling_timeout()
 
-        # Check if we need to attempt reconnection
-        if self.connection_manager.should_attempt_reconnection():
+        # Check if we need to attempt reconnection; the attribute check is
+        # a cheap guard that avoids a method call on every healthy tick
+        if (
+            self.connection_manager.connection_failures
+            and self.connection_manager.should_attempt_reconnection()
+        ):
             self.logger.warning(
                 "Maximum connection failures reached, attempting reconnection"
             )
@@ -105,26 +196,40 @@ class PollingController:
                 self.logger.info("Reconnection successful")
                 # Restart the poll timer if it's not running
                 if not self.is_running():
-                    self.poll_timer.Start(self.default_poll_interval)
+                    self.poll_timer.Start(_TICK_INTERVAL_MS)
             else:
                 self.logger.error("Reconnection failed")
 
+        # Schedule the next poll using the (possibly updated) interval
+        self._next_poll_deadline = (
+            time.monotonic() + self._current_interval_ms / 1000.0
+        )
+
     def set_active_polling(self):
         """Switch to more frequent polling during active communication."""
         if not self.poll_timer:
             return
 
-        current_interval = self.poll_timer.GetInterval()
-        if current_interval != self.active_poll_interval:
+        self._consecutive_empty = 0
+        if self._current_interval_ms != self.active_poll_interval:
             self.logger.debug(
-                f"Switching to active polling interval: {self.active_poll_interval}ms"
+                "Switching to active polling interval: %sms",
+                self.active_poll_interval,
             )
-            self.poll_timer.Stop()
-            self.poll_timer.Start(self.active_poll_interval)
+            self._current_interval_ms = self.active_poll_interval
+
+        # Pull the next poll forward if the current deadline is further away
+        self._next_poll_deadline = min(
+            self._next_poll_deadline,
+            time.monotonic() + self.active_poll_interval / 1000.0,
+        )
 
         # Update the last activity timestamp
         self.last_activity_time = time.time()
-        self.logger.debug(f"Updated last activity time: {self.last_activity_time}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Updated last activity time: %s", self.last_activity_time
+            )
 
     def check_polling_timeout(self):
         """Check if we should return to default polling after period of inactivity."""
@@ -132,21 +237,19 @@ class PollingController:
             return
 
         # Skip if we're already at the default interval
-        current_interval = self.poll_timer.GetInterval()
-        if current_interval == self.default_poll_interval:
+        if self._current_interval_ms == self.default_poll_interval:
             return
 
-        current_time = time.time()
-        elapsed = current_time - self.last_activity_time
-        elapsed_ms = elapsed * 1000  # Convert seconds to milliseconds
+        elapsed = time.time() - self.last_activity_time
 
         # If more than inactivity_timeout has passed, return to default polling
-        if elapsed_ms > self.inactivity_timeout:
+        if elapsed > self._inactivity_timeout_s:
             self.logger.info(
-                f"Inactivity timeout reached ({elapsed:.1f}s). Returning to default polling interval of {self.default_poll_interval}ms"
+                "Inactivity timeout reached (%.1fs). Returning to default polling interval of %sms",
+                elapsed,
+                self.default_poll_interval,
             )
-            self.poll_timer.Stop()
-            self.poll_timer.Start(self.default_poll_interval)
+            self._current_interval_ms = self.default_poll_interval
 
     def should_increase_polling_rate(self, message):
         """Determine if this message should trigger faster polling.
@@ -157,33 +260,12 @@ class PollingController:
         Returns:
             bool: True if polling rate should be increased, False otherwise
         """
-        # Don't increase polling for acknowledgements or telex messages
-        if not isinstance(message, HoppieMessage):
-            return False
-
-        # For telex messages
-        if isinstance(message, TelexMessage):
-            return False
+        # Telex and acknowledgement-only CPDLC messages don't warrant
+        # faster polling; anything else does
+        handler = _POLL_RATE_DISPATCH.get(type(message))
+        if handler is not None:
+            return handler(message)
 
-        # For CPDLC acknowledgements (WILCO, UNABLE, ROGER, etc.)
-        if isinstance(message, CpdlcMessage):
-            content = message.get_packet_content()
-            if content:
-                # Check for common acknowledgement messages
-                ack_responses = [
-                    "WILCO",
-                    "UNABLE",
-                    "ROGER",
-                    "AFFIRM",
-                    "NEGATIVE",
-                    "YES",
-                    "NO",
-                ]
-                clean_content = extract_message_content(content)
-
-                # If the message only contains an acknowledgement, don't increase polling
-                if clean_content in ack_responses:
-                    return False
-
-        # For all other message types, increase polling rate
-        return True
+        # For other message types, increase polling rate (but only for
+        # actual Hoppie messages)
+        return isinstance(message, HoppieMessage)
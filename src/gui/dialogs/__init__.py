@@ -1,29 +1,47 @@
 """
 Dialog modules for the Sim-CPDLC application.
+
+Dialogs are imported lazily (PEP 562) so that importing this package does
+not pull in every dialog module at startup; each submodule loads on first
+attribute access.
 """
 
-from src.gui.dialogs.connect_dialog import ConnectDialog
-from src.gui.dialogs.logon_dialog import LogonDialog
-from src.gui.dialogs.pdc_dialog import PDCDialog
-from src.gui.dialogs.altitude_change_dialog import AltitudeChangeDialog
-from src.gui.dialogs.telex_dialog import TelexDialog
-from src.gui.dialogs.settings_dialog import SettingsDialog
-from src.gui.dialogs.about_dialog import show_about_dialog
-from src.gui.dialogs.atis_dialog import ATISDialog
-from src.gui.dialogs.direct_request_dialog import DirectRequestDialog
-from src.gui.dialogs.speed_request_dialog import SpeedRequestDialog
-from src.gui.dialogs.when_can_we_dialog import WhenCanWeDialog
-
-__all__ = [
-    "ConnectDialog",
-    "LogonDialog",
-    "PDCDialog",
-    "AltitudeChangeDialog",
-    "TelexDialog",
-    "SettingsDialog",
-    "show_about_dialog",
-    "ATISDialog",
-    "DirectRequestDialog",
-    "SpeedRequestDialog",
-    "WhenCanWeDialog",
-]
+import importlib
+
+# Maps exported names to the submodule that defines them
+_LAZY_ATTRIBUTES = {
+    "ConnectDialog": "connect_dialog",
+    "LogonDialog": "logon_dialog",
+    "PDCDialog": "pdc_dialog",
+    "AltitudeChangeDialog": "altitude_change_dialog",
+    "TelexDialog": "telex_dialog",
+    "SettingsDialog": "settings_dialog",
+    "show_about_dialog": "about_dialog",
+    "ATISDialog": "atis_dialog",
+    "DirectRequestDialog": "direct_request_dialog",
+    "SpeedRequestDialog": "speed_request_dialog",
+    "WhenCanWeDialog": "when_can_we_dialog",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    """Import the submodule providing `name` on first access."""
+    try:
+        module_name = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+
+    module = importlib.import_module(f"{__name__}.{module_name}")
+    attribute = getattr(module, name)
+    # Cache on the package so subsequent accesses skip __getattr__
+    globals()[name] = attribute
+    return attribute
+
+
+def __dir__():
+    """Expose the lazy exports to dir() and tab completion."""
+    return sorted(set(globals()) | set(__all__))
@@ -5,6 +5,10 @@ import wx.adv
 
 from src.config import APP_VERSION, GITHUB_URL
 
+# The about info is entirely static, so build it once on first use and
+# reuse it for every subsequent show_about_dialog call
+_INFO = None
+
 
 def show_about_dialog(parent):
     """Display information about the application.
@@ -12,11 +16,15 @@ def show_about_dialog(parent):
     Args:
         parent: The parent window
     """
-    info = wx.adv.AboutDialogInfo()
-    info.SetName("Sim-CPDLC")
-    info.SetVersion(APP_VERSION)
-    info.SetDescription("A simple CPDLC client for SayIntentions.ai and Hoppie ACARS")
-    info.SetCopyright("Copyright (c) 2025 Robin Kipp")
-    info.SetWebSite(GITHUB_URL, "View on GitHub")
+    global _INFO
+    if _INFO is None:
+        _INFO = wx.adv.AboutDialogInfo()
+        _INFO.SetName("Sim-CPDLC")
+        _INFO.SetVersion(APP_VERSION)
+        _INFO.SetDescription(
+            "A simple CPDLC client for SayIntentions.ai and Hoppie ACARS"
+        )
+        _INFO.SetCopyright("Copyright (c) 2025 Robin Kipp")
+        _INFO.SetWebSite(GITHUB_URL, "View on GitHub")
 
-    wx.adv.AboutBox(info)
+    wx.adv.AboutBox(_INFO)
@@ -68,16 +68,12 @@ class AltitudeChangeDialog(wx.Dialog):
         """
         Enable the OK button if altitude is provided and is a valid number.
         """
-        # Only enable the OK button if altitude is provided and is a valid number
+        # Only enable the OK button if altitude is provided and is a valid
+        # number. isdecimal() avoids raising/catching ValueError on every
+        # keystroke; unlike isdigit(), every isdecimal() string is
+        # guaranteed to be accepted by int().
         altitude = self.altitude_text.GetValue().strip()
-        try:
-            fl = int(altitude) if altitude else 0
-            if 10 <= fl <= 600:
-                self.ok_button.Enable()
-            else:
-                self.ok_button.Disable()
-        except ValueError:
-            self.ok_button.Disable()
+        self.ok_button.Enable(altitude.isdecimal() and 10 <= int(altitude) <= 600)
 
     def get_altitude_details(self):
         """
@@ -35,6 +35,8 @@ class ATISDialog(wx.Dialog):
         icao_label = wx.StaticText(self, label="Airport ICAO code:")
         vbox.Add(icao_label, 0, wx.ALL, 5)
         self.icao_text = wx.TextCtrl(self)
+        # Uppercase at input time so the getter never re-allocates the text
+        self.icao_text.ForceUpper()
         vbox.Add(self.icao_text, 0, wx.ALL | wx.EXPAND, 5)
 
         hbox = wx.BoxSizer(wx.HORIZONTAL)
@@ -56,10 +58,7 @@ class ATISDialog(wx.Dialog):
         """
         Enable the OK button if ICAO code is exactly 4 characters.
         """
-        if len(self.icao_text.GetValue().strip()) == 4:
-            self.ok_button.Enable()
-        else:
-            self.ok_button.Disable()
+        self.ok_button.Enable(len(self.icao_text.GetValue().strip()) == 4)
 
     def get_atis_details(self):
         """
@@ -68,6 +67,6 @@ class ATISDialog(wx.Dialog):
         Returns:
             tuple: (icao, request_type) where request_type is "atis" or "metar"
         """
-        icao = self.icao_text.GetValue().strip().upper()
+        icao = self.icao_text.GetValue().strip()
         request_type = "metar" if self.radio_metar.GetValue() else "atis"
         return icao, request_type
@@ -5,7 +5,10 @@ Connect dialog for the Sim-CPDLC application.
 import wx
 import logging
 from src.config import load_config
-from src.utils.simbrief import get_latest_ofp
+
+# Resolved once at import so dialog construction skips the getLogger
+# lock/lookup
+logger = logging.getLogger("Sim-CPDLC")
 
 
 class ConnectDialog(wx.Dialog):
@@ -21,13 +24,14 @@ class ConnectDialog(wx.Dialog):
             parent: The parent window
         """
         wx.Dialog.__init__(self, parent, wx.ID_ANY, "Connect", size=(-1, -1))
-        self.logger = logging.getLogger("Sim-CPDLC")
 
         # Load config to get saved logon codes and SimBrief User ID
         config = load_config()
         self.saved_sayintentions_logon_code = config.get("sayintentions_logon_code", "")
         self.saved_hoppie_logon_code = config.get("hoppie_logon_code", "")
-        simbrief_userid = config.get("simbrief_userid", "")
+        self.simbrief_userid = config.get("simbrief_userid", "")
+        # Deferred until the dialog is actually shown (see ShowModal)
+        self._simbrief_checked = False
 
         vbox = wx.BoxSizer(wx.VERTICAL)
 
@@ -52,43 +56,8 @@ class ConnectDialog(wx.Dialog):
         callsign_label = wx.StaticText(self, label="Callsign:")
         vbox.Add(callsign_label, 0, wx.ALL, 5)
         self.callsign_text = wx.TextCtrl(self)
-
-        # Try to populate callsign from SimBrief if a user ID is available
-        if simbrief_userid:
-            self.logger.debug(
-                f"Attempting to fetch SimBrief OFP for user ID: {simbrief_userid}"
-            )
-            try:
-                ofp_data = get_latest_ofp(simbrief_userid)
-                if ofp_data:
-                    # Extract callsign from OFP data
-                    # The callsign is typically stored as airline code + flight number
-                    # For example: "WAT2088" = "WAT" (airline) + "2088" (flight number)
-                    atc = ofp_data.get("atc", {})
-                    callsign = atc.get("callsign", "")
-
-                    if callsign:
-                        self.logger.info(f"Found callsign in SimBrief OFP: {callsign}")
-                        self.callsign_text.SetValue(callsign)
-                    else:
-                        self.logger.warning(
-                            "Could not extract callsign from SimBrief OFP"
-                        )
-                else:
-                    self.logger.warning("Failed to fetch SimBrief OFP data")
-                    wx.MessageBox(
-                        "Could not fetch flight plan from SimBrief.",
-                        "SimBrief",
-                        wx.OK | wx.ICON_WARNING,
-                    )
-            except Exception as e:
-                self.logger.error(f"Error fetching SimBrief OFP: {str(e)}")
-                wx.MessageBox(
-                    f"Error fetching SimBrief data: {e}",
-                    "SimBrief",
-                    wx.OK | wx.ICON_WARNING,
-                )
-
+        # Uppercase at input time so the getter never re-allocates the text
+        self.callsign_text.ForceUpper()
         vbox.Add(self.callsign_text, 0, wx.ALL | wx.EXPAND, 5)
 
         # Logon code field - create controls but manage visibility later
@@ -114,15 +83,96 @@ class ConnectDialog(wx.Dialog):
 
         self.Fit()
 
+        # Cache the stripped field values so validation and
+        # get_connection_details don't re-read the controls
+        self._callsign_value = self.callsign_text.GetValue().strip()
+        self._logon_code_value = self.logon_code_text.GetValue().strip()
+
         # Bind events
-        self.callsign_text.Bind(wx.EVT_TEXT, self.on_text_change)
-        self.logon_code_text.Bind(wx.EVT_TEXT, self.on_text_change)
+        self.callsign_text.Bind(wx.EVT_TEXT, self.on_callsign_change)
+        self.logon_code_text.Bind(wx.EVT_TEXT, self.on_logon_code_change)
 
         # Update logon code field visibility based on initial network selection
         self.update_logon_code_visibility()
 
-        # Check if fields are valid on initialization
-        self.on_text_change(None)
+        # The callsign starts empty (the SimBrief prefill runs on show),
+        # so the OK button's initial disabled state is already correct;
+        # no validation pass is needed here.
+
+    def reset(self):
+        """Refresh config-derived state before a cached instance is reshown."""
+        config = load_config()
+        self.saved_sayintentions_logon_code = config.get("sayintentions_logon_code", "")
+        self.saved_hoppie_logon_code = config.get("hoppie_logon_code", "")
+        self.simbrief_userid = config.get("simbrief_userid", "")
+        # Re-arm the SimBrief prefill so the next show fetches fresh data
+        self._simbrief_checked = False
+
+        # Re-apply the saved code for the current network selection
+        if self.network_radio_box.GetSelection() == 0:
+            code = self.saved_sayintentions_logon_code
+        else:
+            code = self.saved_hoppie_logon_code
+        self.logon_code_text.ChangeValue(code)
+        self._logon_code_value = code.strip()
+        self.update_logon_code_visibility()
+        self._update_ok_button()
+
+    def ShowModal(self):
+        """Show the dialog, prefilling the callsign from SimBrief first.
+
+        The SimBrief fetch runs here rather than in __init__ so a dialog
+        that is constructed but never shown does no network work.
+        """
+        if not self._simbrief_checked:
+            self._simbrief_checked = True
+            if self.simbrief_userid:
+                self._prefill_callsign_from_simbrief()
+        return super().ShowModal()
+
+    def _prefill_callsign_from_simbrief(self):
+        """Kick off a background SimBrief fetch to populate the callsign.
+
+        The dialog shows immediately; the result is marshalled back to the
+        main thread via wx.CallAfter once the HTTP round-trip finishes.
+        """
+        # Imported here so the HTTP stack only loads when actually needed
+        from src.utils.simbrief import fetch_ofp_async
+
+        logger.debug(
+            "Attempting to fetch SimBrief OFP for user ID: %s", self.simbrief_userid
+        )
+        fetch_ofp_async(
+            self.simbrief_userid,
+            lambda ofp_data: wx.CallAfter(self._on_ofp_fetched, ofp_data),
+        )
+
+    def _on_ofp_fetched(self, ofp_data):
+        """Populate the callsign field from a fetched SimBrief OFP."""
+        # The dialog may have been dismissed while the fetch was in flight
+        if not self:
+            return
+
+        if ofp_data:
+            from src.utils.simbrief import CALLSIGN_PATH, dig
+
+            # Extract callsign from OFP data
+            # The callsign is typically stored as airline code + flight number
+            # For example: "WAT2088" = "WAT" (airline) + "2088" (flight number)
+            callsign = dig(ofp_data, CALLSIGN_PATH)
+
+            if callsign:
+                logger.info("Found callsign in SimBrief OFP: %s", callsign)
+                self.callsign_text.SetValue(callsign)
+            else:
+                logger.warning("Could not extract callsign from SimBrief OFP")
+        else:
+            logger.warning("Failed to fetch SimBrief OFP data")
+            wx.MessageBox(
+                "Could not fetch flight plan from SimBrief.",
+                "SimBrief",
+                wx.OK | wx.ICON_WARNING,
+            )
 
     def update_logon_code_visibility(self):
         """
@@ -138,13 +188,24 @@ class ConnectDialog(wx.Dialog):
         elif selection == 1 and self.saved_hoppie_logon_code:  # Hoppie
             has_logon_code = True
 
-        # Show or hide the logon code field based on whether a logon code exists
-        self.logon_code_label.Show(not has_logon_code)
-        self.logon_code_text.Show(not has_logon_code)
-
-        # Refresh the layout to account for the visibility change
-        self.Layout()
-        self.Fit()
+        # Show the logon code field only when no saved code exists. If the
+        # visibility already matches, skip the Show calls and the full
+        # sizer re-layout they would otherwise trigger.
+        want_shown = not has_logon_code
+        if want_shown == self.logon_code_text.IsShown():
+            return
+
+        # Freeze so toggling the label and field repaints once, not twice
+        self.Freeze()
+        try:
+            self.logon_code_label.Show(want_shown)
+            self.logon_code_text.Show(want_shown)
+
+            # Refresh the layout to account for the visibility change
+            self.Layout()
+            self.Fit()
+        finally:
+            self.Thaw()
 
     def on_network_selection(self, event):
         """
@@ -153,39 +214,43 @@ class ConnectDialog(wx.Dialog):
         """
         selection = self.network_radio_box.GetSelection()
 
+        # ChangeValue doesn't emit EVT_TEXT, so the change handler isn't
+        # run redundantly; update the cached value by hand instead
         if selection == 0:  # SayIntentions
-            self.logon_code_text.SetValue(self.saved_sayintentions_logon_code)
+            self.logon_code_text.ChangeValue(self.saved_sayintentions_logon_code)
         else:  # Hoppie
-            self.logon_code_text.SetValue(self.saved_hoppie_logon_code)
+            self.logon_code_text.ChangeValue(self.saved_hoppie_logon_code)
+        self._logon_code_value = self.logon_code_text.GetValue().strip()
 
         # Update logon code field visibility
         self.update_logon_code_visibility()
 
         # Update button state
-        self.on_text_change(None)
+        self._update_ok_button()
+
+    def on_callsign_change(self, event):
+        """Cache the stripped callsign and refresh OK button state."""
+        self._callsign_value = event.GetString().strip()
+        self._update_ok_button()
 
-    def on_text_change(self, _):
+    def on_logon_code_change(self, event):
+        """Cache the stripped logon code and refresh OK button state."""
+        self._logon_code_value = event.GetString().strip()
+        self._update_ok_button()
+
+    def _update_ok_button(self):
         """
         Enable the OK button if required fields are valid.
         If logon code field is visible, both callsign and logon code must be valid.
         If logon code field is hidden, only callsign needs to be valid.
         """
-        callsign_valid = bool(self.callsign_text.GetValue().strip())
-
-        # Check if logon code field is visible
-        if self.logon_code_text.IsShown():
-            # If visible, both callsign and logon code must be valid
-            logon_code_valid = bool(self.logon_code_text.GetValue().strip())
-            if callsign_valid and logon_code_valid:
-                self.ok_button.Enable()
-            else:
-                self.ok_button.Disable()
-        else:
-            # If hidden, only callsign needs to be valid
-            if callsign_valid:
-                self.ok_button.Enable()
-            else:
-                self.ok_button.Disable()
+        self.ok_button.Enable(
+            bool(self._callsign_value)
+            and (
+                bool(self._logon_code_value)
+                or not self.logon_code_text.IsShown()
+            )
+        )
 
     def get_connection_details(self):
         """
@@ -194,7 +259,7 @@ class ConnectDialog(wx.Dialog):
         Returns:
             tuple: (callsign, logon_code, network_type)
         """
-        callsign = self.callsign_text.GetValue().upper()
+        callsign = self._callsign_value
         selection = self.network_radio_box.GetSelection()
 
         # Determine network type
@@ -208,7 +273,7 @@ class ConnectDialog(wx.Dialog):
             else:  # Hoppie
                 logon_code = self.saved_hoppie_logon_code
         else:
-            # Otherwise use the value entered in the field
-            logon_code = self.logon_code_text.GetValue()
+            # Otherwise use the cached value entered in the field
+            logon_code = self._logon_code_value
 
         return callsign, logon_code, network_type
@@ -18,6 +18,8 @@ class DirectRequestDialog(wx.Dialog):
         fix_label = wx.StaticText(self, label="Fix / Waypoint:")
         vbox.Add(fix_label, 0, wx.ALL, 5)
         self.fix_text = wx.TextCtrl(self)
+        # Uppercase at input time so the getter never re-allocates the text
+        self.fix_text.ForceUpper()
         vbox.Add(self.fix_text, 0, wx.ALL | wx.EXPAND, 5)
 
         helper_text = wx.StaticText(
@@ -56,11 +58,8 @@ class DirectRequestDialog(wx.Dialog):
 
     def on_text_change(self, _):
         """Enable OK button if fix name is valid (2-5 uppercase alpha chars)."""
-        fix = self.fix_text.GetValue().strip().upper()
-        if 2 <= len(fix) <= 5 and fix.isalpha():
-            self.ok_button.Enable()
-        else:
-            self.ok_button.Disable()
+        fix = self.fix_text.GetValue().strip()
+        self.ok_button.Enable(2 <= len(fix) <= 5 and fix.isalpha())
 
     def get_direct_details(self):
         """Get the direct-to request details.
@@ -68,7 +67,7 @@ class DirectRequestDialog(wx.Dialog):
         Returns:
             tuple: (fix, reason) where reason is None, "WEATHER", or "PERFORMANCE"
         """
-        fix = self.fix_text.GetValue().strip().upper()
+        fix = self.fix_text.GetValue().strip()
 
         reason = None
         if self.reason_weather.GetValue():
@@ -24,6 +24,8 @@ class LogonDialog(wx.Dialog):
         station_label = wx.StaticText(self, label="Station:")
         vbox.Add(station_label, 0, wx.ALL, 5)
         self.station_text = wx.TextCtrl(self)
+        # Uppercase at input time so the getter never re-allocates the text
+        self.station_text.ForceUpper()
         vbox.Add(self.station_text, 0, wx.ALL | wx.EXPAND, 5)
 
         hbox = wx.BoxSizer(wx.HORIZONTAL)
@@ -45,10 +47,7 @@ class LogonDialog(wx.Dialog):
         """
         Enable the OK button if station is exactly 4 characters.
         """
-        if len(self.station_text.GetValue().strip()) == 4:
-            self.ok_button.Enable()
-        else:
-            self.ok_button.Disable()
+        self.ok_button.Enable(len(self.station_text.GetValue().strip()) == 4)
 
     def get_logon_details(self):
         """
@@ -57,4 +56,5 @@ class LogonDialog(wx.Dialog):
         Returns:
             str: The station name
         """
-        return self.station_text.GetValue().upper()
+        # Stripped to match the 4-character validation in on_text_change
+        return self.station_text.GetValue().strip()
@@ -5,7 +5,17 @@ Pre-Departure Clearance (PDC) dialog for the Sim-CPDLC application.
 import wx
 import logging
 from src.config import load_config
-from src.utils.simbrief import get_latest_ofp
+from src.utils.simbrief import (
+    AIRCRAFT_ICAO_PATH,
+    DESTINATION_ICAO_PATH,
+    ORIGIN_ICAO_PATH,
+    dig,
+    fetch_ofp_async,
+)
+
+# Resolved once at import so dialog construction skips the getLogger
+# lock/lookup
+logger = logging.getLogger("Sim-CPDLC")
 
 
 class PDCDialog(wx.Dialog):
@@ -21,7 +31,6 @@ class PDCDialog(wx.Dialog):
             parent: The parent window
         """
         wx.Dialog.__init__(self, parent, wx.ID_ANY, "Request PDC", size=(-1, -1))
-        self.logger = logging.getLogger("Sim-CPDLC")
 
         # Load config to get SimBrief User ID
         config = load_config()
@@ -32,79 +41,22 @@ class PDCDialog(wx.Dialog):
         origin_icao_label = wx.StaticText(self, label="Departure ICAO:")
         vbox.Add(origin_icao_label, 0, wx.ALL, 5)
         self.origin_icao_text = wx.TextCtrl(self)
+        # Uppercase at input time so the getters never re-allocate the text
+        self.origin_icao_text.ForceUpper()
         vbox.Add(self.origin_icao_text, 0, wx.ALL | wx.EXPAND, 5)
 
         destination_icao_label = wx.StaticText(self, label="Destination ICAO:")
         vbox.Add(destination_icao_label, 0, wx.ALL, 5)
         self.destination_icao_text = wx.TextCtrl(self)
+        self.destination_icao_text.ForceUpper()
         vbox.Add(self.destination_icao_text, 0, wx.ALL | wx.EXPAND, 5)
 
         aircraft_label = wx.StaticText(self, label="Aircraft code:")
         vbox.Add(aircraft_label, 0, wx.ALL, 5)
         self.aircraft_text = wx.TextCtrl(self)
+        self.aircraft_text.ForceUpper()
         vbox.Add(self.aircraft_text, 0, wx.ALL | wx.EXPAND, 5)
 
-        # Try to populate fields from SimBrief if a user ID is available
-        if simbrief_userid:
-            self.logger.debug(
-                f"Attempting to fetch SimBrief OFP for user ID: {simbrief_userid}"
-            )
-            try:
-                ofp_data = get_latest_ofp(simbrief_userid)
-                if ofp_data:
-                    # Extract departure ICAO
-                    origin = ofp_data.get("origin", {})
-                    origin_icao = origin.get("icao_code", "")
-                    if origin_icao:
-                        self.logger.info(
-                            f"Found departure ICAO in SimBrief OFP: {origin_icao}"
-                        )
-                        self.origin_icao_text.SetValue(origin_icao)
-                    else:
-                        self.logger.warning(
-                            "Could not extract departure ICAO from SimBrief OFP"
-                        )
-
-                    # Extract destination ICAO
-                    destination = ofp_data.get("destination", {})
-                    destination_icao = destination.get("icao_code", "")
-                    if destination_icao:
-                        self.logger.info(
-                            f"Found destination ICAO in SimBrief OFP: {destination_icao}"
-                        )
-                        self.destination_icao_text.SetValue(destination_icao)
-                    else:
-                        self.logger.warning(
-                            "Could not extract destination ICAO from SimBrief OFP"
-                        )
-
-                    # Extract aircraft code
-                    aircraft = ofp_data.get("aircraft", {})
-                    aircraft_icao = aircraft.get("icao_code", "")
-                    if aircraft_icao:
-                        self.logger.info(
-                            f"Found aircraft ICAO in SimBrief OFP: {aircraft_icao}"
-                        )
-                        self.aircraft_text.SetValue(aircraft_icao)
-                    else:
-                        self.logger.warning(
-                            "Could not extract aircraft ICAO from SimBrief OFP"
-                        )
-                else:
-                    self.logger.warning("Failed to fetch SimBrief OFP data")
-                    wx.MessageBox(
-                        "Could not fetch flight plan from SimBrief.",
-                        "SimBrief",
-                        wx.OK | wx.ICON_WARNING,
-                    )
-            except Exception as e:
-                self.logger.error(f"Error fetching SimBrief OFP: {str(e)}")
-                wx.MessageBox(
-                    f"Error fetching SimBrief data: {e}",
-                    "SimBrief",
-                    wx.OK | wx.ICON_WARNING,
-                )
-
         stand_label = wx.StaticText(self, label="Stand number:")
         vbox.Add(stand_label, 0, wx.ALL, 5)
         self.stand_text = wx.TextCtrl(self)
@@ -113,6 +65,7 @@ class PDCDialog(wx.Dialog):
         atis_label = wx.StaticText(self, label="ATIS:")
         vbox.Add(atis_label, 0, wx.ALL, 5)
         self.atis_text = wx.TextCtrl(self)
+        self.atis_text.ForceUpper()
         vbox.Add(self.atis_text, 0, wx.ALL | wx.EXPAND, 5)
 
         hbox = wx.BoxSizer(wx.HORIZONTAL)
@@ -128,32 +81,103 @@ class PDCDialog(wx.Dialog):
 
         self.Fit()
 
-        self.origin_icao_text.Bind(wx.EVT_TEXT, self.on_text_change)
-        self.destination_icao_text.Bind(wx.EVT_TEXT, self.on_text_change)
-        self.aircraft_text.Bind(wx.EVT_TEXT, self.on_text_change)
-        self.stand_text.Bind(wx.EVT_TEXT, self.on_text_change)
-        self.atis_text.Bind(wx.EVT_TEXT, self.on_text_change)
+        # Debounce timer for field validation (see on_text_change)
+        self._pending_validation = None
+
+        # Per-field validity flags, updated only for the control that
+        # fired so a keystroke never re-reads the other four fields.
+        # ICAO fields must be exactly 4 characters; the rest just need
+        # to be non-empty.
+        field_predicates = (
+            (self.origin_icao_text, lambda value: len(value) == 4),
+            (self.destination_icao_text, lambda value: len(value) == 4),
+            (self.aircraft_text, bool),
+            (self.stand_text, bool),
+            (self.atis_text, bool),
+        )
+        self._field_valid = [False] * len(field_predicates)
+        for index, (ctrl, predicate) in enumerate(field_predicates):
+            ctrl.Bind(wx.EVT_TEXT, self._make_field_handler(index, predicate))
+
+        # Try to populate fields from SimBrief if a user ID is available.
+        # The fetch runs on a background thread so the dialog opens
+        # immediately; results arrive via wx.CallAfter.
+        if simbrief_userid:
+            logger.debug(
+                "Attempting to fetch SimBrief OFP for user ID: %s", simbrief_userid
+            )
+            fetch_ofp_async(
+                simbrief_userid,
+                lambda ofp_data: wx.CallAfter(self._on_ofp_fetched, ofp_data),
+            )
+
+    def reset(self):
+        """Re-run the SimBrief prefill before a cached instance is reshown."""
+        config = load_config()
+        simbrief_userid = config.get("simbrief_userid", "")
+        if simbrief_userid:
+            logger.debug(
+                "Attempting to fetch SimBrief OFP for user ID: %s", simbrief_userid
+            )
+            fetch_ofp_async(
+                simbrief_userid,
+                lambda ofp_data: wx.CallAfter(self._on_ofp_fetched, ofp_data),
+            )
+
+    def _on_ofp_fetched(self, ofp_data):
+        """Populate the flight plan fields from a fetched SimBrief OFP."""
+        # The dialog may have been dismissed while the fetch was in flight
+        if not self:
+            return
+
+        if not ofp_data:
+            logger.warning("Failed to fetch SimBrief OFP data")
+            wx.MessageBox(
+                "Could not fetch flight plan from SimBrief.",
+                "SimBrief",
+                wx.OK | wx.ICON_WARNING,
+            )
+            return
+
+        # Extract the departure, destination and aircraft codes with one
+        # table-driven loop instead of three copies of the same block
+        fields = (
+            (ORIGIN_ICAO_PATH, self.origin_icao_text, "departure ICAO"),
+            (DESTINATION_ICAO_PATH, self.destination_icao_text, "destination ICAO"),
+            (AIRCRAFT_ICAO_PATH, self.aircraft_text, "aircraft ICAO"),
+        )
+        for path, ctrl, description in fields:
+            value = dig(ofp_data, path)
+            if value:
+                logger.info(
+                    "Found %s in SimBrief OFP: %s", description, value
+                )
+                ctrl.SetValue(value)
+            else:
+                logger.warning(
+                    "Could not extract %s from SimBrief OFP", description
+                )
+
+    def _make_field_handler(self, index, predicate):
+        """Build an EVT_TEXT handler that validates a single field."""
+
+        def handler(event):
+            self._field_valid[index] = bool(predicate(event.GetString().strip()))
+            self.on_text_change(event)
+
+        return handler
 
     def on_text_change(self, _):
-        """
-        Enable the OK button if all fields are provided and ICAO codes are 4 chars.
-        """
-        origin = self.origin_icao_text.GetValue().strip()
-        dest = self.destination_icao_text.GetValue().strip()
-        aircraft = self.aircraft_text.GetValue().strip()
-        stand = self.stand_text.GetValue().strip()
-        atis = self.atis_text.GetValue().strip()
-
-        if (
-            len(origin) == 4
-            and len(dest) == 4
-            and aircraft
-            and stand
-            and atis
-        ):
-            self.ok_button.Enable()
-        else:
-            self.ok_button.Disable()
+        """Schedule an OK-button refresh, coalescing bursts of keystrokes."""
+        if self._pending_validation and self._pending_validation.IsRunning():
+            self._pending_validation.Stop()
+        self._pending_validation = wx.CallLater(50, self._do_validate)
+
+    def _do_validate(self):
+        """Enable the OK button when every field's validity flag is set."""
+        if not self:
+            return
+        self.ok_button.Enable(all(self._field_valid))
 
     def get_pdc_details(self):
         """
@@ -162,10 +186,11 @@ class PDCDialog(wx.Dialog):
         Returns:
             tuple: (origin_icao, destination_icao, aircraft_code, stand_designator, atis_code)
         """
+        # The controls force uppercase input, so no .upper() passes here
         return (
-            self.origin_icao_text.GetValue().upper(),
-            self.destination_icao_text.GetValue().upper(),
-            self.aircraft_text.GetValue().upper(),
+            self.origin_icao_text.GetValue(),
+            self.destination_icao_text.GetValue(),
+            self.aircraft_text.GetValue(),
             self.stand_text.GetValue(),
-            self.atis_text.GetValue().upper(),
+            self.atis_text.GetValue(),
         )
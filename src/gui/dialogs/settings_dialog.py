@@ -4,6 +4,31 @@ Settings dialog for the Sim-CPDLC application.
 
 import wx
 
+# Help-text literals hoisted to module scope so each dialog open reuses the
+# same interned strings instead of re-building them per section
+_HELP_TEXTS = {
+    "sayintentions": (
+        "This logon code will be used for all connections to the SayIntentions.ai ACARS.\n"
+        "You will not need to enter it in the Connect dialog."
+    ),
+    "hoppie": (
+        "This logon code will be used for all connections to the Hoppie.nl ACARS.\n"
+        "You will not need to enter it in the Connect dialog."
+    ),
+    "simbrief": (
+        "Enter your SimBrief User ID to fetch your flight plans.\n"
+        "You can find this in your SimBrief account settings."
+    ),
+    "auto_update": (
+        "When enabled, the application will check for updates when it starts.\n"
+        "You can always check for updates manually from the File menu."
+    ),
+    "auto_tune": (
+        "When enabled, receiving a CONTACT or MONITOR instruction will\n"
+        "automatically set the frequency as COM1 standby in MSFS via SimConnect."
+    ),
+}
+
 
 class SettingsDialog(wx.Dialog):
     """
@@ -18,6 +43,7 @@ class SettingsDialog(wx.Dialog):
         simbrief_userid="",
         auto_check_updates=True,
         auto_tune_com1=True,
+        show_update_option=True,
     ):
         """
         Initialize the settings dialog.
@@ -28,12 +54,45 @@ class SettingsDialog(wx.Dialog):
             hoppie_logon_code (str): The current Hoppie logon code to display
             simbrief_userid (str): The current SimBrief User ID to display
             auto_check_updates (bool): Whether to automatically check for updates
+            auto_tune_com1 (bool): Whether to auto-tune COM1 standby on CONTACT/MONITOR
+            show_update_option (bool): Whether to build the auto-update section at all
         """
         wx.Dialog.__init__(self, parent, wx.ID_ANY, "Settings", size=(-1, -1))
 
+        # Preserved so get_settings can return the incoming value when the
+        # update section isn't built
+        self._auto_check_updates = auto_check_updates
+
         vbox = wx.BoxSizer(wx.VERTICAL)
 
-        # SayIntentions Logon code field
+        # Build the sections inside a Freeze/Thaw pair so the native
+        # widgets are created without intermediate repaints. All sections
+        # stay eagerly built: screen readers need the full dialog present
+        # when it opens.
+        self.Freeze()
+        try:
+            self._build_sayintentions_section(vbox, sayintentions_logon_code)
+            vbox.Add(wx.StaticLine(self), 0, wx.EXPAND | wx.ALL, 5)
+            self._build_hoppie_section(vbox, hoppie_logon_code)
+            vbox.Add(wx.StaticLine(self), 0, wx.EXPAND | wx.ALL, 5)
+            self._build_simbrief_section(vbox, simbrief_userid)
+            vbox.Add(wx.StaticLine(self), 0, wx.EXPAND | wx.ALL, 5)
+            # Callers that hide the update option skip three native
+            # widget allocations plus a separator
+            self.auto_check_updates_checkbox = None
+            if show_update_option:
+                self._build_auto_update_section(vbox, auto_check_updates)
+                vbox.Add(wx.StaticLine(self), 0, wx.EXPAND | wx.ALL, 5)
+            self._build_auto_tune_section(vbox, auto_tune_com1)
+            self._build_buttons(vbox)
+
+            self.SetSizer(vbox)
+            self.Fit()
+        finally:
+            self.Thaw()
+
+    def _build_sayintentions_section(self, vbox, sayintentions_logon_code):
+        """Build the SayIntentions logon code field and its help text."""
         sayintentions_logon_code_label = wx.StaticText(
             self, label="SayIntentions Logon code:"
         )
@@ -42,87 +101,54 @@ class SettingsDialog(wx.Dialog):
         self.sayintentions_logon_code_text.SetValue(sayintentions_logon_code)
         vbox.Add(self.sayintentions_logon_code_text, 0, wx.ALL | wx.EXPAND, 5)
 
-        # Help text for SayIntentions logon code
-        sayintentions_help_text = wx.StaticText(
-            self,
-            label="This logon code will be used for all connections to the SayIntentions.ai ACARS.\n"
-            "You will not need to enter it in the Connect dialog.",
-        )
-        vbox.Add(sayintentions_help_text, 0, wx.ALL, 5)
-
-        # Add a separator
-        vbox.Add(wx.StaticLine(self), 0, wx.EXPAND | wx.ALL, 5)
+        self._add_help(vbox, "sayintentions")
 
-        # Hoppie Logon code field
+    def _build_hoppie_section(self, vbox, hoppie_logon_code):
+        """Build the Hoppie logon code field and its help text."""
         hoppie_logon_code_label = wx.StaticText(self, label="Hoppie Logon code:")
         vbox.Add(hoppie_logon_code_label, 0, wx.ALL, 5)
         self.hoppie_logon_code_text = wx.TextCtrl(self)
         self.hoppie_logon_code_text.SetValue(hoppie_logon_code)
         vbox.Add(self.hoppie_logon_code_text, 0, wx.ALL | wx.EXPAND, 5)
 
-        # Help text for Hoppie logon code
-        hoppie_help_text = wx.StaticText(
-            self,
-            label="This logon code will be used for all connections to the Hoppie.nl ACARS.\n"
-            "You will not need to enter it in the Connect dialog.",
-        )
-        vbox.Add(hoppie_help_text, 0, wx.ALL, 5)
-
-        # Add a separator
-        vbox.Add(wx.StaticLine(self), 0, wx.EXPAND | wx.ALL, 5)
+        self._add_help(vbox, "hoppie")
 
-        # SimBrief User ID field
+    def _build_simbrief_section(self, vbox, simbrief_userid):
+        """Build the SimBrief User ID field and its help text."""
         simbrief_label = wx.StaticText(self, label="SimBrief User ID:")
         vbox.Add(simbrief_label, 0, wx.ALL, 5)
         self.simbrief_userid_text = wx.TextCtrl(self)
         self.simbrief_userid_text.SetValue(simbrief_userid)
         vbox.Add(self.simbrief_userid_text, 0, wx.ALL | wx.EXPAND, 5)
 
-        # Help text for SimBrief User ID
-        simbrief_help_text = wx.StaticText(
-            self,
-            label="Enter your SimBrief User ID to fetch your flight plans.\n"
-            "You can find this in your SimBrief account settings.",
-        )
-        vbox.Add(simbrief_help_text, 0, wx.ALL, 5)
-
-        # Add a separator
-        vbox.Add(wx.StaticLine(self), 0, wx.EXPAND | wx.ALL, 5)
+        self._add_help(vbox, "simbrief")
 
-        # Auto-update checkbox
+    def _build_auto_update_section(self, vbox, auto_check_updates):
+        """Build the auto-update checkbox and its help text."""
         self.auto_check_updates_checkbox = wx.CheckBox(
             self, label="Automatically check for updates"
         )
         self.auto_check_updates_checkbox.SetValue(auto_check_updates)
         vbox.Add(self.auto_check_updates_checkbox, 0, wx.ALL, 5)
 
-        # Help text for auto-update
-        auto_update_help_text = wx.StaticText(
-            self,
-            label="When enabled, the application will check for updates when it starts.\n"
-            "You can always check for updates manually from the File menu.",
-        )
-        vbox.Add(auto_update_help_text, 0, wx.ALL, 5)
-
-        # Add a separator
-        vbox.Add(wx.StaticLine(self), 0, wx.EXPAND | wx.ALL, 5)
+        self._add_help(vbox, "auto_update")
 
-        # Auto-tune COM1 checkbox
+    def _build_auto_tune_section(self, vbox, auto_tune_com1):
+        """Build the auto-tune COM1 checkbox and its help text."""
         self.auto_tune_com1_checkbox = wx.CheckBox(
             self, label="Auto-tune COM1 standby on CONTACT/MONITOR"
         )
         self.auto_tune_com1_checkbox.SetValue(auto_tune_com1)
         vbox.Add(self.auto_tune_com1_checkbox, 0, wx.ALL, 5)
 
-        # Help text for auto-tune COM1
-        auto_tune_help_text = wx.StaticText(
-            self,
-            label="When enabled, receiving a CONTACT or MONITOR instruction will\n"
-            "automatically set the frequency as COM1 standby in MSFS via SimConnect.",
-        )
-        vbox.Add(auto_tune_help_text, 0, wx.ALL, 5)
+        self._add_help(vbox, "auto_tune")
 
-        # Buttons
+    def _add_help(self, vbox, key):
+        """Add the help StaticText for `key` from the shared label table."""
+        vbox.Add(wx.StaticText(self, label=_HELP_TEXTS[key]), 0, wx.ALL, 5)
+
+    def _build_buttons(self, vbox):
+        """Build the Save/Cancel button row."""
         hbox = wx.BoxSizer(wx.HORIZONTAL)
         self.ok_button = wx.Button(self, wx.ID_OK, label="Save")
         cancel_button = wx.Button(self, wx.ID_CANCEL, label="Cancel")
@@ -131,20 +157,23 @@ class SettingsDialog(wx.Dialog):
 
         vbox.Add(hbox, 0, wx.ALIGN_CENTER)
 
-        self.SetSizer(vbox)
-        self.Fit()
-
     def get_settings(self):
         """
         Get the settings entered by the user.
 
         Returns:
-            tuple: (sayintentions_logon_code, hoppie_logon_code, simbrief_userid, auto_check_updates)
+            tuple: (sayintentions_logon_code, hoppie_logon_code, simbrief_userid,
+                auto_check_updates, auto_tune_com1)
         """
+        auto_check_updates = (
+            self.auto_check_updates_checkbox.GetValue()
+            if self.auto_check_updates_checkbox is not None
+            else self._auto_check_updates
+        )
         return (
             self.sayintentions_logon_code_text.GetValue(),
             self.hoppie_logon_code_text.GetValue(),
             self.simbrief_userid_text.GetValue(),
-            self.auto_check_updates_checkbox.GetValue(),
+            auto_check_updates,
             self.auto_tune_com1_checkbox.GetValue(),
         )
@@ -82,23 +82,9 @@ class SpeedRequestDialog(wx.Dialog):
 
     def on_text_change(self, _):
         """Enable OK button if speed value is valid."""
+        # Both Mach (e.g. 82, 082) and knots (e.g. 250, 300) are 2-3 digits
         speed = self.speed_text.GetValue().strip()
-        if not speed.isdigit():
-            self.ok_button.Disable()
-            return
-
-        if self.radio_mach.GetValue():
-            # Mach: 2-3 digits (e.g. 82, 082)
-            if 2 <= len(speed) <= 3:
-                self.ok_button.Enable()
-            else:
-                self.ok_button.Disable()
-        else:
-            # Knots: 2-3 digits (e.g. 250, 300)
-            if 2 <= len(speed) <= 3:
-                self.ok_button.Enable()
-            else:
-                self.ok_button.Disable()
+        self.ok_button.Enable(speed.isdigit() and 2 <= len(speed) <= 3)
 
     def get_speed_details(self):
         """Get the speed request details.
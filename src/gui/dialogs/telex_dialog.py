@@ -24,13 +24,18 @@ class TelexDialog(wx.Dialog):
         recipient_label = wx.StaticText(self, label="To:")
         vbox.Add(recipient_label, 0, wx.ALL, 5)
         self.recipient_text = wx.TextCtrl(self)
-        # Use the get_current_station method from MainWindow
-        self.recipient_text.SetValue(parent.get_current_station())
+        # Uppercase at input time so the getter never re-allocates the text
+        self.recipient_text.ForceUpper()
         vbox.Add(self.recipient_text, 0, wx.ALL | wx.EXPAND, 5)
 
+        # Populate the default recipient once the dialog is up, so
+        # construction never blocks on the parent's session state
+        wx.CallAfter(self._populate_recipient, parent)
+
         message_label = wx.StaticText(self, label="Message:")
         vbox.Add(message_label, 0, wx.ALL, 5)
         self.message_text = wx.TextCtrl(self, style=wx.TE_MULTILINE, size=(-1, 100))
+        self.message_text.ForceUpper()
         vbox.Add(self.message_text, 1, wx.ALL | wx.EXPAND, 5)
 
         hbox = wx.BoxSizer(wx.HORIZONTAL)
@@ -49,17 +54,26 @@ class TelexDialog(wx.Dialog):
         self.recipient_text.Bind(wx.EVT_TEXT, self.on_text_change)
         self.message_text.Bind(wx.EVT_TEXT, self.on_text_change)
 
+    def reset(self):
+        """Refresh the default recipient before a cached instance is reshown."""
+        wx.CallAfter(self._populate_recipient, self.GetParent())
+
+    def _populate_recipient(self, parent):
+        """Fill in the current station as the default recipient."""
+        if not self:
+            return
+        # Use the get_current_station method from MainWindow; SetValue
+        # fires EVT_TEXT, which refreshes the OK button state
+        self.recipient_text.SetValue(parent.get_current_station())
+
     def on_text_change(self, _):
         """
         Enable the OK button if both recipient and message are provided.
         """
-        if (
-            self.recipient_text.GetValue().strip()
-            and self.message_text.GetValue().strip()
-        ):
-            self.ok_button.Enable()
-        else:
-            self.ok_button.Disable()
+        self.ok_button.Enable(
+            bool(self.recipient_text.GetValue().strip())
+            and bool(self.message_text.GetValue().strip())
+        )
 
     def get_telex_details(self):
         """
@@ -68,7 +82,9 @@ class TelexDialog(wx.Dialog):
         Returns:
             tuple: (recipient, message)
         """
+        # Both controls force uppercase input, so no .upper() pass is
+        # needed over the (potentially large) message body
         return (
-            self.recipient_text.GetValue().upper(),
-            self.message_text.GetValue().upper(),
+            self.recipient_text.GetValue(),
+            self.message_text.GetValue(),
         )
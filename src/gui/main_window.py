@@ -1,8 +1,11 @@
 """Main window for the Sim-CPDLC application."""
 
+import collections
+import functools
 import os
 import re
 import sys
+import time
 import wx
 import wx.adv
 
@@ -21,6 +24,8 @@ from src.config import (
     INACTIVITY_TIMEOUT,
     MAX_CONNECTION_FAILURES,
     MESSAGE_SOUND_FILENAME,
+    CONFIG_FILE,
+    DEFAULT_CONFIG,
     load_config,
     save_config,
 )
@@ -30,37 +35,39 @@ from src.model.message_manager import MessageManager
 from src.model.cpdlc_session import CpdlcSession
 from src.controller.polling_controller import PollingController
 from src.gui.message_view import MessageView
-from src.gui.dialogs import (
-    ConnectDialog,
-    LogonDialog,
-    PDCDialog,
-    AltitudeChangeDialog,
-    TelexDialog,
-    ATISDialog,
-    DirectRequestDialog,
-    SpeedRequestDialog,
-    WhenCanWeDialog,
-    show_about_dialog,
-)
+# The dialogs package resolves its exports lazily (PEP 562); importing
+# the package object instead of the names keeps every dialog submodule
+# unloaded until a handler first touches it
+from src.gui import dialogs
 from src.utils.message_formatting import extract_message_content
 from src.utils.update_checker import UpdateChecker
 from src.utils.simconnect_manager import SimConnectManager
 from src.utils.frequency_parser import extract_contact_frequency
-from src.gui.dialogs.settings_dialog import SettingsDialog
+
+# Resource base path, resolved once at import time. PyInstaller creates a
+# temp folder and stores its path in _MEIPASS; in a dev checkout we fall
+# back to the working directory.
+_BASE_PATH = getattr(sys, "_MEIPASS", None) or os.path.abspath(".")
+
+# Notification sound location, resolved once alongside the base path so
+# window construction skips the path join and existence syscall
+_SOUND_PATH = os.path.join(_BASE_PATH, "assets", MESSAGE_SOUND_FILENAME)
+_SOUND_PATH_EXISTS = os.path.exists(_SOUND_PATH)
+
+# Session-state protocol messages, matched in a single scan: group 1 is
+# LOGON ACCEPTED, group 2 is LOGOFF, group 3 captures the HANDOVER target
+_CPDLC_STATE_RE = re.compile(
+    r"^(?:(LOGON ACCEPTED)|(LOGOFF)|HANDOVER\s+([A-Z]{4}))$"
+)
 
 
 class MainWindow(wx.Frame):
     """Main application window for the Sim-CPDLC client."""
 
-    def resource_path(self, relative_path):
+    @staticmethod
+    def resource_path(relative_path):
         """Get absolute path to resource, works for dev and for PyInstaller."""
-        try:
-            # PyInstaller creates a temp folder and stores path in _MEIPASS
-            base_path = sys._MEIPASS
-        except Exception:
-            base_path = os.path.abspath(".")
-
-        return os.path.join(base_path, relative_path)
+        return os.path.join(_BASE_PATH, relative_path)
 
     def __init__(self, parent, title, logger):
         """Initialize the main window with UI and connection settings."""
@@ -68,21 +75,45 @@ class MainWindow(wx.Frame):
         self.logger = logger
         self.logger.debug("Initializing MainWindow")
 
-        # Initialize model components
-        self.connection_manager = ConnectionManager(logger)
-        self.message_manager = MessageManager(logger)
-        self.cpdlc_session = CpdlcSession(logger, self.connection_manager)
+        # Model/controller components are lazy (see the cached_property
+        # block below); only SimConnect is set up eagerly since it owns
+        # an external connection attempt
         self.simconnect_manager = SimConnectManager()
 
+        # Cached dialog instances, built once per class and reused across
+        # menu clicks (see _get_dialog)
+        self._dialogs = {}
+
+        # Recently seen message keys for duplicate suppression: the deque
+        # bounds memory, the set gives the O(1) membership test
+        self._seen_queue = collections.deque(maxlen=512)
+        self._seen_keys = set()
+
+        # Monotonic timestamp of the last notification sound, used to
+        # rate-limit playback on message bursts
+        self._last_sound_ts = 0.0
+
+        # Dirty flag for coalescing set_active_polling calls (see
+        # _arm_active_polling)
+        self._active_polling_pending = False
+
         # Check if this is the first launch (config file just created)
         self._check_first_launch()
 
-        # Initialize sound for new messages
-        sound_path = self.resource_path(os.path.join("assets", MESSAGE_SOUND_FILENAME))
-        if os.path.exists(sound_path):
-            self.new_message_sound = wx.adv.Sound(sound_path)
+        # Initialize sound for new messages. The WAV is decoded into the
+        # Sound object once here, so playback on each incoming message is
+        # a replay of the cached handle rather than a disk read.
+        if _SOUND_PATH_EXISTS:
+            self.new_message_sound = wx.adv.Sound(_SOUND_PATH)
+            if not self.new_message_sound.IsOk():
+                self.logger.warning(
+                    "Sound file at %s could not be decoded; notification "
+                    "sounds disabled",
+                    _SOUND_PATH,
+                )
+                self.new_message_sound = None
         else:
-            error_msg = f"Sound file not found at {sound_path}. The program will work as expected, however you will not hear a notification sound when a new CPDLC message arrives. To restore the notification sound, please quit the app and double-check that the sound file exists at the specified path."
+            error_msg = f"Sound file not found at {_SOUND_PATH}. The program will work as expected, however you will not hear a notification sound when a new CPDLC message arrives. To restore the notification sound, please quit the app and double-check that the sound file exists at the specified path."
             self.logger.warning(error_msg)
             wx.MessageBox(error_msg, "Missing Sound File", wx.OK | wx.ICON_WARNING)
             self.new_message_sound = None
@@ -90,26 +121,24 @@ class MainWindow(wx.Frame):
         # Initialize UI
         self._init_ui()
 
-        # Initialize update checker
-        self.update_checker = UpdateChecker(self, logger)
-
         # Check for updates if enabled in settings
         config = load_config()
         if config.get("auto_check_updates", True):
             self.logger.debug("Auto-update check enabled, checking for updates")
-            self.update_checker.check_for_updates()
+            # Deferred so window construction and first paint finish before
+            # the update checker is even constructed
+            wx.CallLater(500, lambda: self.update_checker.check_for_updates())
         else:
             self.logger.debug("Auto-update check disabled")
 
-        # Initialize controller
-        self.polling_controller = PollingController(
-            logger,
-            self.connection_manager,
-            self._on_message_received,
-            DEFAULT_POLL_INTERVAL,
-            ACTIVE_POLL_INTERVAL,
-            INACTIVITY_TIMEOUT,
-        )
+        # Warm the SimBrief OFP cache in the background so the Connect and
+        # PDC dialogs open with their fields already available
+        simbrief_userid = config.get("simbrief_userid", "")
+        if simbrief_userid:
+            from src.utils.simbrief import fetch_ofp_async
+
+            self.logger.debug("Prefetching SimBrief OFP at startup")
+            fetch_ofp_async(simbrief_userid, lambda ofp_data: None)
 
         # Bind the close event to handle ALT+F4 and other direct close operations
         self.Bind(wx.EVT_CLOSE, self.on_close)
@@ -117,6 +146,43 @@ class MainWindow(wx.Frame):
         self.Show(True)
         self.logger.debug("MainWindow initialization complete")
 
+    # Model/controller components, constructed on first use so a session
+    # that never connects (e.g. opened just to edit settings) skips them.
+    # cached_property stores the built instance in __dict__, so later
+    # accesses are plain attribute reads.
+
+    @functools.cached_property
+    def connection_manager(self):
+        """Connection manager, built on first use."""
+        return ConnectionManager(self.logger)
+
+    @functools.cached_property
+    def message_manager(self):
+        """Message manager, built on first use."""
+        return MessageManager(self.logger)
+
+    @functools.cached_property
+    def cpdlc_session(self):
+        """CPDLC session, built on first use."""
+        return CpdlcSession(self.logger, self.connection_manager)
+
+    @functools.cached_property
+    def update_checker(self):
+        """Update checker, built on first use."""
+        return UpdateChecker(self, self.logger)
+
+    @functools.cached_property
+    def polling_controller(self):
+        """Polling controller, built on first use."""
+        return PollingController(
+            self.logger,
+            self.connection_manager,
+            self._on_messages_received,
+            DEFAULT_POLL_INTERVAL,
+            ACTIVE_POLL_INTERVAL,
+            INACTIVITY_TIMEOUT,
+        )
+
     def _init_ui(self):
         """Set up the application's user interface components."""
         # Create main panel
@@ -191,21 +257,25 @@ class MainWindow(wx.Frame):
 
         self.SetMenuBar(menu_bar)
 
-        # Bind menu events
-        self.Bind(wx.EVT_MENU, self.on_about, menu_item_about)
-        self.Bind(wx.EVT_MENU, self.on_connect_or_disconnect, self.menu_item_connect)
-        self.Bind(wx.EVT_MENU, self.on_settings, menu_item_settings)
-        self.Bind(wx.EVT_MENU, self.on_check_updates, menu_item_check_updates)
-        self.Bind(wx.EVT_MENU, self.on_pdc_request, menu_item_pdc)
-        self.Bind(wx.EVT_MENU, self.on_logon, menu_item_logon)
-        self.Bind(wx.EVT_MENU, self.on_logoff, self.menu_item_logoff)
-        self.Bind(wx.EVT_MENU, self.on_altitude_change, menu_item_altitude_change)
-        self.Bind(wx.EVT_MENU, self.on_direct_request, menu_item_direct)
-        self.Bind(wx.EVT_MENU, self.on_speed_request, menu_item_speed)
-        self.Bind(wx.EVT_MENU, self.on_when_can_we_expect, menu_item_when)
-        self.Bind(wx.EVT_MENU, self.on_telex, menu_item_telex)
-        self.Bind(wx.EVT_MENU, self.on_atis_request, menu_item_atis)
-        self.Bind(wx.EVT_MENU, self.on_exit, menu_item_exit)
+        # Bind menu events from a single table
+        bindings = (
+            (menu_item_about, self.on_about),
+            (self.menu_item_connect, self.on_connect_or_disconnect),
+            (menu_item_settings, self.on_settings),
+            (menu_item_check_updates, self.on_check_updates),
+            (menu_item_pdc, self.on_pdc_request),
+            (menu_item_logon, self.on_logon),
+            (self.menu_item_logoff, self.on_logoff),
+            (menu_item_altitude_change, self.on_altitude_change),
+            (menu_item_direct, self.on_direct_request),
+            (menu_item_speed, self.on_speed_request),
+            (menu_item_when, self.on_when_can_we_expect),
+            (menu_item_telex, self.on_telex),
+            (menu_item_atis, self.on_atis_request),
+            (menu_item_exit, self.on_exit),
+        )
+        for item, handler in bindings:
+            self.Bind(wx.EVT_MENU, handler, item)
 
     def on_settings(self, _):
         """Display settings dialog and save any changes."""
@@ -219,7 +289,7 @@ class MainWindow(wx.Frame):
         current_auto_check_updates = config.get("auto_check_updates", True)
         current_auto_tune_com1 = config.get("auto_tune_com1", True)
 
-        dlg = SettingsDialog(
+        dlg = dialogs.SettingsDialog(
             self,
             current_sayintentions_logon_code,
             current_hoppie_logon_code,
@@ -261,6 +331,8 @@ class MainWindow(wx.Frame):
         else:
             self.logger.debug("Settings dialog cancelled")
 
+        # Not cached: the settings dialog is rebuilt from the current
+        # config on each open
         dlg.Destroy()
 
     def on_check_updates(self, _):
@@ -270,7 +342,7 @@ class MainWindow(wx.Frame):
 
     def on_about(self, _):
         """Display information about the application."""
-        show_about_dialog(self)
+        dialogs.show_about_dialog(self)
 
     def on_connect_or_disconnect(self, _):
         """Toggle connection state based on current status."""
@@ -281,10 +353,27 @@ class MainWindow(wx.Frame):
             # Disconnect
             self.on_disconnect()
 
+    def _get_dialog(self, dialog_class):
+        """Return a cached instance of `dialog_class`, constructing it once.
+
+        Dialog construction is expensive (native widget tree, sizers), so
+        instances are kept for the life of the window. Classes exposing a
+        reset() method get it called before each show to refresh any state
+        that depends on the current config or session.
+        """
+        dlg = self._dialogs.get(dialog_class)
+        if dlg is None:
+            dlg = dialog_class(self)
+            self._dialogs[dialog_class] = dlg
+        reset = getattr(dlg, "reset", None)
+        if reset is not None:
+            reset()
+        return dlg
+
     def on_connect(self):
         """Establish connection to the CPDLC network."""
         self.logger.debug("Opening connection dialog")
-        dlg = ConnectDialog(self)
+        dlg = self._get_dialog(dialogs.ConnectDialog)
         if dlg.ShowModal() == wx.ID_OK:
             callsign, logon_code, network_type = dlg.get_connection_details()
 
@@ -311,7 +400,34 @@ class MainWindow(wx.Frame):
                 # Add system message
                 self._add_custom_message(f"Connected as {callsign}", "SYSTEM")
 
-        dlg.Destroy()
+
+    def _confirm(self, message, caption, on_yes, on_cancel=None):
+        """Ask a yes/no question without blocking the main loop.
+
+        ShowWindowModal avoids the nested event loop that wx.MessageBox
+        spins up, so polling and async callbacks keep running while the
+        question is on screen. The continuation runs once the dialog
+        closes.
+
+        Args:
+            message: The question text
+            caption: The dialog title
+            on_yes: Callable invoked if the user confirms
+            on_cancel: Optional callable invoked if the user declines
+        """
+        dlg = wx.MessageDialog(
+            self, message, caption, wx.YES_NO | wx.ICON_QUESTION
+        )
+
+        def _on_closed(event):
+            dlg.Destroy()
+            if event.GetReturnCode() == wx.ID_YES:
+                on_yes()
+            elif on_cancel is not None:
+                on_cancel()
+
+        dlg.Bind(wx.EVT_WINDOW_MODAL_DIALOG_CLOSED, _on_closed)
+        dlg.ShowWindowModal()
 
     def on_disconnect(self):
         """Disconnect from the CPDLC network."""
@@ -319,39 +435,46 @@ class MainWindow(wx.Frame):
             return
 
         # Check if logged on to a station
-        if self.cpdlc_session.is_logged_on():
+        status = self.cpdlc_session.snapshot()
+        if status.logged_on:
             # Confirm disconnect with warning about active logon
-            confirm_message = f"You are currently logged on to {self.cpdlc_session.get_current_station()}. If you disconnect, you will be logged off from this station.\n\nAre you sure you want to disconnect from the CPDLC network?"
+            confirm_message = f"You are currently logged on to {status.station}. If you disconnect, you will be logged off from this station.\n\nAre you sure you want to disconnect from the CPDLC network?"
         else:
             # Standard confirmation
             confirm_message = (
                 "Are you sure you want to disconnect from the CPDLC network?"
             )
 
-        # Confirm disconnect
-        if (
-            wx.MessageBox(
-                confirm_message,
-                "Confirm Disconnect",
-                wx.YES_NO | wx.ICON_QUESTION,
-            )
-            != wx.YES
-        ):
-            self.logger.debug("Disconnect cancelled by user")
-            return
+        self._confirm(
+            confirm_message,
+            "Confirm Disconnect",
+            self._do_disconnect,
+            lambda: self.logger.debug("Disconnect cancelled by user"),
+        )
 
+    def _do_disconnect(self):
+        """Carry out a confirmed disconnect."""
         self.logger.info("Disconnecting from CPDLC network")
 
         # If logged on to a station, send logoff message first
         if self.cpdlc_session.is_logged_on():
-            success, message = self.cpdlc_session.send_logoff_message()
+            success, message = self.cpdlc_session.logoff()
             if success and message:
                 self._add_custom_message(message)
-            self.polling_controller.set_active_polling()
+            self._arm_active_polling()
+
+            # Give the logoff message time to go out, then finish the
+            # disconnect. Unlike wx.MilliSleep, CallLater keeps the UI
+            # responsive during the wait; the connect menu entry is
+            # disabled so the user can't reconnect mid-teardown.
+            self.menu_item_connect.Enable(False)
+            wx.CallLater(500, self._finish_disconnect)
+            return
 
-            # Small delay to allow the message to be sent
-            wx.MilliSleep(500)  # 500ms delay
+        self._finish_disconnect()
 
+    def _finish_disconnect(self):
+        """Stop polling, drop the connection and update the UI."""
         # Stop polling
         self.polling_controller.stop()
 
@@ -359,6 +482,7 @@ class MainWindow(wx.Frame):
         self.connection_manager.disconnect()
 
         # Update UI
+        self.menu_item_connect.Enable(True)
         self.menu_item_connect.SetItemLabel("&Connect")
         self.menu_item_connect.SetHelp("Connect to the CPDLC network")
         self.SetStatusText("Disconnected from CPDLC network.")
@@ -378,20 +502,12 @@ class MainWindow(wx.Frame):
             return
 
         self.logger.debug("Opening logon dialog")
-        dlg = LogonDialog(self)
+        dlg = self._get_dialog(dialogs.LogonDialog)
         if dlg.ShowModal() == wx.ID_OK:
+            # The dialog's OK button only enables for a 4-character
+            # station, so no re-validation (and no second modal loop) here
             station = dlg.get_logon_details()
 
-            # Validate station name is exactly 4 characters
-            if len(station) != 4:
-                wx.MessageBox(
-                    "Station name must be exactly 4 characters long.",
-                    "Invalid Station Name",
-                    wx.OK | wx.ICON_ERROR,
-                )
-                dlg.Destroy()
-                return
-
             success, message = self.cpdlc_session.logon(station)
             if success:
                 # Add custom message only if a message was returned from the session
@@ -402,7 +518,7 @@ class MainWindow(wx.Frame):
                 self.SetStatusText(f"Pending logon to {station}.")
 
                 # Set active polling
-                self.polling_controller.set_active_polling()
+                self._arm_active_polling()
             else:
                 error_detail = f": {message}" if message else ""
                 wx.MessageBox(
@@ -411,11 +527,11 @@ class MainWindow(wx.Frame):
                     wx.OK | wx.ICON_ERROR,
                 )
 
-        dlg.Destroy()
 
     def on_logoff(self, _):
         """Initiate logoff from current CPDLC station."""
-        if not self.cpdlc_session.is_logged_on():
+        status = self.cpdlc_session.snapshot()
+        if not status.logged_on:
             wx.MessageBox(
                 "You are not currently logged on to any station.",
                 "Not Logged On",
@@ -424,18 +540,16 @@ class MainWindow(wx.Frame):
             return
 
         # Confirm logoff
-        station = self.cpdlc_session.get_current_station()
-        if (
-            wx.MessageBox(
-                f"Are you sure you want to log off from {station}?",
-                "Confirm Logoff",
-                wx.YES_NO | wx.ICON_QUESTION,
-            )
-            != wx.YES
-        ):
-            self.logger.debug("Logoff cancelled by user")
-            return
+        station = status.station
+        self._confirm(
+            f"Are you sure you want to log off from {station}?",
+            "Confirm Logoff",
+            lambda: self._do_logoff(station),
+            lambda: self.logger.debug("Logoff cancelled by user"),
+        )
 
+    def _do_logoff(self, station):
+        """Carry out a confirmed logoff from `station`."""
         success, message = self.cpdlc_session.logoff()
         if success:
             if message:
@@ -445,7 +559,7 @@ class MainWindow(wx.Frame):
             self.SetStatusText(f"Logged off from {station}.")
 
             # Set active polling
-            self.polling_controller.set_active_polling()
+            self._arm_active_polling()
         else:
             error_detail = f": {message}" if message else ""
             wx.MessageBox(
@@ -474,7 +588,7 @@ class MainWindow(wx.Frame):
             return
 
         self.logger.debug("Opening altitude change dialog")
-        dlg = AltitudeChangeDialog(self)
+        dlg = self._get_dialog(dialogs.AltitudeChangeDialog)
         if dlg.ShowModal() == wx.ID_OK:
             altitude, reason = dlg.get_altitude_details()
 
@@ -486,7 +600,7 @@ class MainWindow(wx.Frame):
                     self._add_custom_message(message)
 
                 # Set active polling
-                self.polling_controller.set_active_polling()
+                self._arm_active_polling()
             else:
                 error_detail = f": {message}" if message else ""
                 wx.MessageBox(
@@ -495,7 +609,6 @@ class MainWindow(wx.Frame):
                     wx.OK | wx.ICON_ERROR,
                 )
 
-        dlg.Destroy()
 
     def on_direct_request(self, _):
         """Send a direct-to waypoint request."""
@@ -515,7 +628,7 @@ class MainWindow(wx.Frame):
             )
             return
 
-        dlg = DirectRequestDialog(self)
+        dlg = self._get_dialog(dialogs.DirectRequestDialog)
         if dlg.ShowModal() == wx.ID_OK:
             fix, reason = dlg.get_direct_details()
 
@@ -523,7 +636,7 @@ class MainWindow(wx.Frame):
             if success:
                 if message:
                     self._add_custom_message(message)
-                self.polling_controller.set_active_polling()
+                self._arm_active_polling()
             else:
                 error_detail = f": {message}" if message else ""
                 wx.MessageBox(
@@ -532,7 +645,6 @@ class MainWindow(wx.Frame):
                     wx.OK | wx.ICON_ERROR,
                 )
 
-        dlg.Destroy()
 
     def on_speed_request(self, _):
         """Send a speed/Mach change request."""
@@ -552,7 +664,7 @@ class MainWindow(wx.Frame):
             )
             return
 
-        dlg = SpeedRequestDialog(self)
+        dlg = self._get_dialog(dialogs.SpeedRequestDialog)
         if dlg.ShowModal() == wx.ID_OK:
             speed, is_mach, reason = dlg.get_speed_details()
 
@@ -562,7 +674,7 @@ class MainWindow(wx.Frame):
             if success:
                 if message:
                     self._add_custom_message(message)
-                self.polling_controller.set_active_polling()
+                self._arm_active_polling()
             else:
                 error_detail = f": {message}" if message else ""
                 wx.MessageBox(
@@ -571,7 +683,6 @@ class MainWindow(wx.Frame):
                     wx.OK | wx.ICON_ERROR,
                 )
 
-        dlg.Destroy()
 
     def on_when_can_we_expect(self, _):
         """Send a when-can-we-expect inquiry."""
@@ -591,7 +702,7 @@ class MainWindow(wx.Frame):
             )
             return
 
-        dlg = WhenCanWeDialog(self)
+        dlg = self._get_dialog(dialogs.WhenCanWeDialog)
         if dlg.ShowModal() == wx.ID_OK:
             message_text = dlg.get_message_text()
 
@@ -599,7 +710,7 @@ class MainWindow(wx.Frame):
             if success:
                 if message:
                     self._add_custom_message(message)
-                self.polling_controller.set_active_polling()
+                self._arm_active_polling()
             else:
                 error_detail = f": {message}" if message else ""
                 wx.MessageBox(
@@ -608,7 +719,6 @@ class MainWindow(wx.Frame):
                     wx.OK | wx.ICON_ERROR,
                 )
 
-        dlg.Destroy()
 
     def get_current_station(self):
         """Get the current station from the CPDLC session.
@@ -616,11 +726,7 @@ class MainWindow(wx.Frame):
         Returns:
             str: The current station or empty string if not logged on
         """
-        return (
-            self.cpdlc_session.get_current_station()
-            if self.cpdlc_session.is_logged_on()
-            else ""
-        )
+        return self.cpdlc_session.snapshot().station
 
     def on_telex(self, _):
         """Send a telex message to specified recipient."""
@@ -634,7 +740,7 @@ class MainWindow(wx.Frame):
             return
 
         self.logger.debug("Opening telex dialog")
-        dlg = TelexDialog(self)
+        dlg = self._get_dialog(dialogs.TelexDialog)
         if dlg.ShowModal() == wx.ID_OK:
             recipient, message = dlg.get_telex_details()
 
@@ -652,7 +758,6 @@ class MainWindow(wx.Frame):
                     wx.OK | wx.ICON_ERROR,
                 )
 
-        dlg.Destroy()
 
     def on_atis_request(self, _):
         """Request ATIS information for an airport."""
@@ -665,7 +770,7 @@ class MainWindow(wx.Frame):
             return
 
         self.logger.debug("Opening weather information request dialog")
-        dlg = ATISDialog(self)
+        dlg = self._get_dialog(dialogs.ATISDialog)
         if dlg.ShowModal() == wx.ID_OK:
             icao, request_type = dlg.get_atis_details()
 
@@ -686,7 +791,6 @@ class MainWindow(wx.Frame):
                     wx.OK | wx.ICON_ERROR,
                 )
 
-        dlg.Destroy()
 
     def on_pdc_request(self, _):
         """Request a pre-departure clearance from departure airport."""
@@ -700,7 +804,7 @@ class MainWindow(wx.Frame):
             return
 
         self.logger.debug("Opening PDC request dialog")
-        dlg = PDCDialog(self)
+        dlg = self._get_dialog(dialogs.PDCDialog)
         if dlg.ShowModal() == wx.ID_OK:
             (
                 origin_icao,
@@ -722,7 +826,7 @@ class MainWindow(wx.Frame):
                     self._add_custom_message(message)
 
                 # Set active polling
-                self.polling_controller.set_active_polling()
+                self._arm_active_polling()
             else:
                 error_detail = f": {message}" if message else ""
                 wx.MessageBox(
@@ -731,7 +835,6 @@ class MainWindow(wx.Frame):
                     wx.OK | wx.ICON_ERROR,
                 )
 
-        dlg.Destroy()
 
     def _add_custom_message(self, text, sender=None):
         """Add a custom message to the message list.
@@ -747,13 +850,34 @@ class MainWindow(wx.Frame):
         self.message_view.add_message(message_id)
 
         # Don't play sound for outgoing messages (from user's callsign) or system messages
-        # Sound should only play for incoming messages, which are handled in _on_message_received
+        # Sound should only play for incoming messages, which are handled in _on_messages_received
+
+    def _on_messages_received(self, messages):
+        """Handle a batch of received messages from one poll.
+
+        Args:
+            messages: List of received messages
+        """
+        new_ids = []
+        for message in messages:
+            message_id = self._process_incoming(message)
+            if message_id is not None:
+                new_ids.append(message_id)
+
+        if new_ids:
+            # One view refresh and one sound for the whole batch
+            self.message_view.add_messages(new_ids)
+            self._play_message_sound()
 
-    def _on_message_received(self, message):
-        """Handle received messages from the network.
+    def _process_incoming(self, message):
+        """Process a single received message without touching the view.
 
         Args:
             message: The received message
+
+        Returns:
+            Optional[int]: The new message ID, or None if the message was
+                filtered out or rejected
         """
         # Check for protocol noise messages before adding to view
         if hasattr(message, "get_packet_content") and hasattr(
@@ -764,17 +888,27 @@ class MainWindow(wx.Frame):
             pre_msg_text = " ".join(pre_msg_text.replace("@", " ").split())
             if pre_msg_text.startswith("CURRENT ATC UNIT") or pre_msg_text.startswith("CURRENT ATS UNIT"):
                 self.logger.debug(f"Hiding protocol message: {pre_msg_text}")
-                return
+                return None
+
+            # Drop exact duplicates (e.g. a poll retry redelivering the
+            # same packet) before they reach the manager, the sound and
+            # the session-state handlers
+            key = (
+                message.get_from_name(),
+                message.get_min() if hasattr(message, "get_min") else None,
+                hash(raw_content),
+            )
+            if key in self._seen_keys:
+                self.logger.debug(f"Suppressing duplicate message: {pre_msg_text}")
+                return None
+            if len(self._seen_queue) == self._seen_queue.maxlen:
+                self._seen_keys.discard(self._seen_queue.popleft())
+            self._seen_queue.append(key)
+            self._seen_keys.add(key)
 
         # Add to message manager
         message_id = self.message_manager.add_message(message)
         if message_id >= 0:
-            # Add to view
-            self.message_view.add_message(message_id)
-
-            # Play sound for new messages
-            self._play_message_sound()
-
             # Check for special messages that affect CPDLC session state
             if hasattr(message, "get_packet_content") and hasattr(
                 message, "get_from_name"
@@ -785,8 +919,12 @@ class MainWindow(wx.Frame):
                 # Normalize @ separators to spaces for protocol-level matching
                 msg_text = " ".join(msg_text.replace("@", " ").split())
 
+                # Match all session-state messages in one scan; dispatch
+                # on the capture group that fired
+                state_match = _CPDLC_STATE_RE.match(msg_text)
+
                 # Check for LOGON ACCEPTED message
-                if msg_text == "LOGON ACCEPTED":
+                if state_match is not None and state_match.group(1):
                     # Handle automatic handovers or explicit logon acceptance
                     mrn = message.get_mrn() if hasattr(message, "get_mrn") else None
                     self.cpdlc_session.handle_logon_accepted(sender, mrn=mrn)
@@ -794,11 +932,11 @@ class MainWindow(wx.Frame):
                     self.SetStatusText(f"Logged on to {sender}.")
                     self.logger.info(f"Logon accepted by {sender}")
 
-                # Check for HANDOVER message from current station
+                # State changes below only apply to the current station
                 elif sender == self.cpdlc_session.get_current_station():
-                    match = re.match(r"^HANDOVER\s+([A-Z]{4})$", msg_text)
-                    if match:
-                        new_station = match.group(1)
+                    # Check for HANDOVER message from current station
+                    if state_match is not None and state_match.group(3):
+                        new_station = state_match.group(3)
                         self.logger.info(
                             f"Handover detected from {sender} to {new_station}"
                         )
@@ -818,7 +956,7 @@ class MainWindow(wx.Frame):
                             if message:
                                 self._add_custom_message(message)
                             self.SetStatusText(f"Pending logon to {new_station}.")
-                            self.polling_controller.set_active_polling()
+                            self._arm_active_polling()
                         else:
                             error_detail = f": {message}" if message else ""
                             self.logger.error(
@@ -830,7 +968,7 @@ class MainWindow(wx.Frame):
                             )
 
                     # Check for LOGOFF message from current station
-                    elif msg_text == "LOGOFF":
+                    elif state_match is not None and state_match.group(2):
                         self.cpdlc_session.handle_station_logoff(sender)
                         # Update UI
                         self.SetStatusText(f"Logged off from {sender}.")
@@ -855,6 +993,8 @@ class MainWindow(wx.Frame):
                                 self.SetStatusText(
                                     f"Auto-tune failed \u2014 set {freq:.3f} manually"
                                 )
+            return message_id
+        return None
 
     def _on_acknowledge_message(self, message, response):
         """Handle message acknowledgement.
@@ -880,7 +1020,7 @@ class MainWindow(wx.Frame):
                 self._add_custom_message(returned_message)
 
             # Set active polling
-            self.polling_controller.set_active_polling()
+            self._arm_active_polling()
         else:
             error_detail = f": {returned_message}" if returned_message else ""
             wx.MessageBox(
@@ -889,9 +1029,34 @@ class MainWindow(wx.Frame):
                 wx.OK | wx.ICON_ERROR,
             )
 
+    def _arm_active_polling(self):
+        """Request active polling, coalescing bursts into one call.
+
+        A flurry of acknowledgements or a multi-message poll can request
+        the faster rate many times in one event-loop pass; the dirty flag
+        collapses them into a single controller call on the next tick.
+        """
+        if self._active_polling_pending:
+            return
+        self._active_polling_pending = True
+        wx.CallAfter(self._flush_active_polling)
+
+    def _flush_active_polling(self):
+        """Apply a pending active-polling request."""
+        self._active_polling_pending = False
+        self.polling_controller.set_active_polling()
+
     def _play_message_sound(self):
-        """Play sound notification for new messages."""
+        """Play sound notification for new messages.
+
+        Rate-limited to one playback per 250ms so a burst of messages
+        doesn't stack overlapping decodes on the OS mixer.
+        """
         if self.new_message_sound:
+            now = time.monotonic()
+            if now - self._last_sound_ts < 0.25:
+                return
+            self._last_sound_ts = now
             self.new_message_sound.Play(wx.adv.SOUND_ASYNC)
             self.logger.debug("Played message notification sound")
 
@@ -899,8 +1064,12 @@ class MainWindow(wx.Frame):
         """Handle application close event and perform cleanup."""
         self.logger.info("Application close event triggered")
 
-        # If connected, show confirmation dialog
-        if self.connection_manager.is_connected():
+        # If connected, show confirmation dialog. The __dict__ check keeps
+        # the lazy connection manager unbuilt when the user never connected.
+        if (
+            "connection_manager" in self.__dict__
+            and self.connection_manager.is_connected()
+        ):
             if not self._confirm_exit(event):
                 return
 
@@ -908,13 +1077,18 @@ class MainWindow(wx.Frame):
 
             # If logged on to a station, send logoff message first
             if self.cpdlc_session.is_logged_on():
-                success, message = self.cpdlc_session.send_logoff_message()
+                success, message = self.cpdlc_session.logoff()
                 if success and message:
                     self._add_custom_message(message)
 
             # Stop polling
             self.polling_controller.stop()
 
+        # Tear down the cached dialog instances
+        for dlg in self._dialogs.values():
+            dlg.Destroy()
+        self._dialogs.clear()
+
         self.simconnect_manager.disconnect()
         self.logger.info("Application shutting down")
         event.Skip()  # Allow the window to close
@@ -926,9 +1100,9 @@ class MainWindow(wx.Frame):
             bool: True if exit confirmed, False otherwise
         """
         # Prepare confirmation message based on connection state
-        if self.cpdlc_session.is_logged_on():
-            station = self.cpdlc_session.get_current_station()
-            confirm_message = f"You are currently connected to the CPDLC network and logged on to {station}.\n\nAre you sure you want to exit the application? You will be logged off from the station."
+        status = self.cpdlc_session.snapshot()
+        if status.logged_on:
+            confirm_message = f"You are currently connected to the CPDLC network and logged on to {status.station}.\n\nAre you sure you want to exit the application? You will be logged off from the station."
         else:
             confirm_message = "You are currently connected to the CPDLC network.\n\nAre you sure you want to exit the application?"
 
@@ -949,9 +1123,6 @@ class MainWindow(wx.Frame):
 
     def _check_first_launch(self):
         """Check if this is the first launch and prompt for settings if needed."""
-        import os
-        from src.config import CONFIG_FILE, load_config, save_config, DEFAULT_CONFIG
-
         # Check if config file exists
         config_file_exists = os.path.exists(CONFIG_FILE)
 
@@ -975,7 +1146,7 @@ class MainWindow(wx.Frame):
             )
 
             result = dlg.ShowModal()
-            dlg.Destroy()
+            dlg.Destroy()  # one-shot first-launch prompt, not cached
 
             if result == wx.ID_YES:
                 self.logger.debug("User chose to set up settings on first launch")
@@ -2,13 +2,72 @@
 
 import wx
 
-from hoppie_connector import HoppieMessage, CpdlcMessage
+from hoppie_connector import CpdlcMessage
 from src.model.message_manager import MessageManager
 
 
+class _VirtualMessageList(wx.ListCtrl):
+    """Virtual list control backed by parallel per-column arrays.
+
+    With wx.LC_VIRTUAL the native control only asks for the rows it
+    paints (via OnGetItemText), so appending a message is an O(1) array
+    append plus SetItemCount instead of a native insert per row, and
+    redraw cost tracks the viewport rather than the total message count.
+    """
+
+    def __init__(self, parent):
+        wx.ListCtrl.__init__(self, parent, style=wx.LC_REPORT | wx.LC_VIRTUAL)
+        # Structure-of-arrays backing store, indexed by row
+        self._ids = []
+        self._senders = []
+        self._texts = []
+
+    def OnGetItemText(self, item, col):
+        """Return the text for a visible cell on demand."""
+        if col == 0:
+            return self._senders[item]
+        return self._texts[item]
+
+    def append_row(self, message_id, sender, text):
+        """Append one message row and refresh only that row."""
+        self._ids.append(message_id)
+        self._senders.append(sender)
+        self._texts.append(text)
+        count = len(self._ids)
+        self.SetItemCount(count)
+        self.RefreshItem(count - 1)
+
+    def id_at(self, index):
+        """Return the message ID backing a row index."""
+        return self._ids[index]
+
+    def clear_rows(self):
+        """Drop all rows."""
+        self._ids.clear()
+        self._senders.clear()
+        self._texts.clear()
+        self.SetItemCount(0)
+        self.Refresh()
+
+
 class MessageView:
     """Handles display and interaction with CPDLC messages."""
 
+    # Fixed attribute layout: no per-instance __dict__, faster attribute
+    # access in the selection and context-menu handlers
+    __slots__ = (
+        "parent",
+        "logger",
+        "message_manager",
+        "on_acknowledge",
+        "message_list",
+        "message_detail",
+        "_detail_cache",
+        "_menu_cache",
+        "_menu_message",
+        "_shown_detail_id",
+    )
+
     def __init__(
         self, parent, logger, message_manager: MessageManager, on_acknowledge=None
     ):
@@ -25,6 +84,20 @@ class MessageView:
         self.message_manager = message_manager
         self.on_acknowledge = on_acknowledge
 
+        # Detail text memoized per message ID so re-selecting a message
+        # skips the manager lookup and formatting
+        self._detail_cache = {}
+
+        # Context menus cached per distinct response tuple; they live for
+        # the lifetime of the view. _menu_message carries the message the
+        # popped-up menu should acknowledge.
+        self._menu_cache = {}
+        self._menu_message = None
+
+        # ID of the message currently shown in the detail pane, so
+        # re-selecting the same row skips the text update entirely
+        self._shown_detail_id = None
+
         self._init_ui()
 
     def _init_ui(self):
@@ -32,26 +105,43 @@ class MessageView:
         # Create a horizontal box sizer
         hbox = wx.BoxSizer(wx.HORIZONTAL)
 
-        # Create message list
-        self.message_list = wx.ListCtrl(self.parent, style=wx.LC_REPORT)
-        self.message_list.InsertColumn(0, "Sender", width=-1)
-        self.message_list.InsertColumn(1, "Message", width=-1)
-        self.message_list.SetToolTip("Messages received from the CPDLC network.")
-        hbox.Add(self.message_list, 1, wx.ALL, 5)
+        # Freeze while the controls are created so the initial layout
+        # paints once
+        self.parent.Freeze()
+        try:
+            # Create message list
+            self.message_list = _VirtualMessageList(self.parent)
+            self.message_list.InsertColumn(0, "Sender", width=-1)
+            self.message_list.InsertColumn(1, "Message", width=-1)
+            self.message_list.SetToolTip(
+                "Messages received from the CPDLC network."
+            )
+            hbox.Add(self.message_list, 1, wx.ALL, 5)
 
-        # Create message detail view
-        self.message_detail = wx.TextCtrl(
-            self.parent, style=wx.TE_MULTILINE | wx.TE_READONLY
-        )
-        hbox.Add(self.message_detail, 1, wx.ALL, 5)
+            # Create message detail view
+            self.message_detail = wx.TextCtrl(
+                self.parent, style=wx.TE_MULTILINE | wx.TE_READONLY
+            )
+            hbox.Add(self.message_detail, 1, wx.ALL, 5)
+
+            # Set the sizer for the parent panel
+            self.parent.SetSizer(hbox)
+        finally:
+            self.parent.Thaw()
 
-        # Set the sizer for the parent panel
-        self.parent.SetSizer(hbox)
+        # Compute column widths once after construction instead of on
+        # every insert
+        wx.CallAfter(self._autosize_columns)
 
         # Bind events
         self.message_list.Bind(wx.EVT_LIST_ITEM_SELECTED, self.on_message_selected)
         self.message_list.Bind(wx.EVT_CONTEXT_MENU, self.on_context_menu)
 
+    def _autosize_columns(self):
+        """Size the columns once the control is laid out."""
+        self.message_list.SetColumnWidth(0, wx.LIST_AUTOSIZE_USEHEADER)
+        self.message_list.SetColumnWidth(1, wx.LIST_AUTOSIZE_USEHEADER)
+
     def add_message(self, message_id: int):
         """Add a message to the list view.
 
@@ -62,13 +152,30 @@ class MessageView:
         if not sender:
             return
 
-        index = self.message_list.InsertItem(self.message_list.GetItemCount(), sender)
-        self.message_list.SetItem(index, 1, display_text)
-        self.message_list.SetItemData(index, message_id)
+        self.message_list.append_row(message_id, sender, display_text)
+
+    def add_messages(self, message_ids):
+        """Add a batch of messages to the list view in one pass.
+
+        Freeze/Thaw suppresses the per-row repaints so a multi-message
+        poll paints once at the end.
+
+        Args:
+            message_ids: Iterable of message IDs to add
+        """
+        self.message_list.Freeze()
+        try:
+            for message_id in message_ids:
+                self.add_message(message_id)
+        finally:
+            self.message_list.Thaw()
+        self.message_list.Refresh()
 
     def clear(self):
         """Clear all messages from the view."""
-        self.message_list.DeleteAllItems()
+        self.message_list.clear_rows()
+        self._detail_cache.clear()
+        self._shown_detail_id = None
         self.message_detail.Clear()
 
     def on_message_selected(self, event):
@@ -79,13 +186,24 @@ class MessageView:
         """
         selected_index = event.GetIndex()
         if 0 <= selected_index < self.message_list.GetItemCount():
-            message_id = self.message_list.GetItemData(selected_index)
+            message_id = self.message_list.id_at(selected_index)
 
             self.logger.debug(f"Message selected: ID={message_id}")
 
-            # Get the detailed text for the message
-            detail_text = self.message_manager.get_message_detail_text(message_id)
-            self.message_detail.SetValue(detail_text)
+            # Re-clicking the already-shown row is a no-op
+            if message_id == self._shown_detail_id:
+                return
+
+            # Get the detailed text for the message (cached per ID)
+            detail_text = self._detail_cache.get(message_id)
+            if detail_text is None:
+                detail_text = self.message_manager.get_message_detail_text(
+                    message_id
+                )
+                self._detail_cache[message_id] = detail_text
+            # ChangeValue skips the EVT_TEXT dispatch that SetValue fires
+            self.message_detail.ChangeValue(detail_text)
+            self._shown_detail_id = message_id
 
     def on_context_menu(self, event):
         """Show context menu for message responses.
@@ -98,15 +216,15 @@ class MessageView:
             self.logger.debug("Context menu requested but no message selected")
             return
 
-        message_id = self.message_list.GetItemData(selected_index)
-        message = self.message_manager.get_message(message_id)
+        message_id = self.message_list.id_at(selected_index)
 
-        if not isinstance(message, HoppieMessage):
+        # Kind tags recorded by the manager replace an isinstance MRO walk
+        if self.message_manager.get_kind(message_id) == "custom":
             self.logger.debug(f"Selected item (ID={message_id}) is not a HoppieMessage")
             return
-
-        self.logger.debug(f"Checking message: {message}")
-        needs_ack, responses = self.message_manager.needs_acknowledgement(message)
+        message, needs_ack, responses = self.message_manager.get_ack_info(
+            message_id
+        )
 
         if not needs_ack:
             self.logger.debug(
@@ -115,26 +233,29 @@ class MessageView:
             return
 
         self.logger.debug(f"Showing context menu with responses: {responses}")
-        menu = wx.Menu()
 
-        menu_items = []
-        for response in responses:
-            menu_item = menu.Append(wx.ID_ANY, f"Respond: {response}")
-            menu_items.append(menu_item)
-            self.parent.Bind(
+        # Menus are built once per distinct response tuple and reused;
+        # the dispatcher reads the target message from _menu_message so
+        # the cached menu works for any row
+        key = tuple(responses)
+        cached = self._menu_cache.get(key)
+        if cached is None:
+            menu = wx.Menu()
+            id_to_response = {}
+            for response in responses:
+                menu_item = menu.Append(wx.ID_ANY, f"Respond: {response}")
+                id_to_response[menu_item.GetId()] = response
+            menu.Bind(
                 wx.EVT_MENU,
-                lambda event, resp=response, msg=message: self._handle_acknowledge(
-                    msg, resp
+                lambda event: self._handle_acknowledge(
+                    self._menu_message, id_to_response[event.GetId()]
                 ),
-                menu_item,
             )
+            cached = menu
+            self._menu_cache[key] = cached
 
-        self.parent.PopupMenu(menu)
-
-        for menu_item in menu_items:
-            self.parent.Unbind(wx.EVT_MENU, id=menu_item.GetId())
-
-        menu.Destroy()
+        self._menu_message = message
+        self.parent.PopupMenu(cached)
 
     def _handle_acknowledge(self, message: CpdlcMessage, response: str):
         """Handle acknowledgement of a message.
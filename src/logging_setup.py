@@ -1,23 +1,75 @@
 """Logging configuration for the Sim-CPDLC application."""
 
+import atexit
 import os
 import logging
-from logging.handlers import RotatingFileHandler
+import time
+from logging.handlers import MemoryHandler, RotatingFileHandler
 from src.config import get_user_data_dir
 
 
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that reuses the strftime result within the same second.
+
+    The default Formatter calls time.strftime for every record; the
+    second-resolution part of the timestamp is identical for all records
+    emitted within one second, so cache it and only append the per-record
+    milliseconds.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._last_second = None
+        self._last_strftime = ""
+
+    def formatTime(self, record, datefmt=None):
+        second = int(record.created)
+        if second != self._last_second:
+            self._last_second = second
+            self._last_strftime = time.strftime(
+                datefmt or self.default_time_format,
+                self.converter(record.created),
+            )
+        s = self._last_strftime
+        if not datefmt and self.default_msec_format:
+            s = self.default_msec_format % (s, record.msecs)
+        return s
+
+
+class FastRotatingFileHandler(RotatingFileHandler):
+    """RotatingFileHandler with a cheaper rollover check.
+
+    The stock shouldRollover stats the log file on every emit; this
+    variant (the CPython gh-105623 ordering) only touches the filesystem
+    once the size threshold is actually reached.
+    """
+
+    def shouldRollover(self, record):
+        if self.stream is None:
+            self.stream = self._open()
+        if self.maxBytes > 0:
+            msg_len = len(self.format(record)) + 1
+            if self.stream.tell() + msg_len >= self.maxBytes:
+                return os.path.isfile(self.baseFilename)
+        return False
+
+
 def setup_logging():
     """Configure application logging with console and rotating file handlers."""
     # Create logger
     logger = logging.getLogger("Sim-CPDLC")
     logger.setLevel(logging.INFO)
 
-    # Prevent duplicate handlers if logger already exists
-    if logger.handlers:
-        return logger
+    # Prevent duplicate handlers if logging is already configured. The
+    # check looks for our file-backed handler specifically (it sits behind
+    # the MemoryHandler wrapper), so a re-entrant call never re-opens the
+    # rotating log file.
+    for handler in logger.handlers:
+        if isinstance(handler, (MemoryHandler, RotatingFileHandler)):
+            return logger
 
     # Configure log format
-    log_formatter = logging.Formatter(
+    log_formatter = _CachedTimeFormatter(
         "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     )
 
@@ -32,11 +84,22 @@ def setup_logging():
         log_dir = get_user_data_dir()
         log_file = os.path.join(log_dir, "sim-cpdlc.log")
 
-        file_handler = RotatingFileHandler(
+        file_handler = FastRotatingFileHandler(
             log_file, maxBytes=10 * 1024 * 1024, backupCount=5  # 10MB
         )
         file_handler.setFormatter(log_formatter)
-        logger.addHandler(file_handler)
+
+        # Buffer emits in memory and write to disk in batches; ERROR and
+        # above still flush immediately. atexit guarantees the tail of
+        # the buffer reaches the file on shutdown.
+        buffered_handler = MemoryHandler(
+            capacity=512,
+            flushLevel=logging.ERROR,
+            target=file_handler,
+            flushOnClose=True,
+        )
+        logger.addHandler(buffered_handler)
+        atexit.register(buffered_handler.close)
         logger.info(f"Logging to file: {log_file}")
     except (IOError, PermissionError) as e:
         # Log to console if file handler creation fails
@@ -1,6 +1,9 @@
 """Connection management for the CPDLC client."""
 
+import functools
 import logging
+from concurrent.futures import ThreadPoolExecutor
+
 import wx
 import requests
 
@@ -8,10 +11,33 @@ from hoppie_connector import HoppieConnector, HoppieError
 
 from src.config import SAYINTENTIONS_API_URL, HOPPIE_API_URL
 
+# Resolved once; unknown network types fall back to SayIntentions, matching
+# the old if/else default
+URL_BY_NETWORK = {
+    "hoppie": HOPPIE_API_URL,
+    "sayintentions": SAYINTENTIONS_API_URL,
+}
+
 
 class ConnectionManager:
     """Manages network connections to the CPDLC service."""
 
+    # Fixed attribute layout: no per-instance __dict__, faster attribute
+    # access in the poll/send hot paths
+    __slots__ = (
+        "logger",
+        "cnx",
+        "callsign",
+        "logon_code",
+        "network_type",
+        "connection_failures",
+        "max_connection_failures",
+        "message_callback",
+        "_api_url",
+        "_make_connector",
+        "_poll_executor",
+    )
+
     def __init__(self, logger, message_callback=None):
         """Initialize the connection manager.
 
@@ -27,6 +53,15 @@ class ConnectionManager:
         self.connection_failures = 0
         self.max_connection_failures = 3
         self.message_callback = message_callback
+        self._api_url = SAYINTENTIONS_API_URL
+        self._make_connector = functools.partial(
+            HoppieConnector, url=SAYINTENTIONS_API_URL
+        )
+        # Single worker so polls never overlap; used by poll_async to keep
+        # the blocking HTTP round-trip off the GUI thread
+        self._poll_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="cpdlc-poll"
+        )
 
     def is_connected(self):
         """Check if currently connected to the network."""
@@ -44,21 +79,20 @@ class ConnectionManager:
             HoppieError: If connection fails
         """
         self.logger.info(
-            f"Attempting to connect as {callsign} to {network_type} network"
+            "Attempting to connect as %s to %s network", callsign, network_type
         )
 
-        # Select the appropriate API URL based on network type
-        if network_type == "hoppie":
-            api_url = HOPPIE_API_URL
-        else:  # Default to SayIntentions
-            api_url = SAYINTENTIONS_API_URL
+        # Select the appropriate API URL based on network type, resolved
+        # once here so reconnection and info requests just read it back.
+        # The partial pre-binds the URL, specializing connector creation
+        # for the chosen network.
+        self._api_url = URL_BY_NETWORK.get(network_type, SAYINTENTIONS_API_URL)
+        self._make_connector = functools.partial(
+            HoppieConnector, url=self._api_url
+        )
 
         try:
-            self.cnx = HoppieConnector(
-                callsign,
-                logon_code,
-                url=api_url,
-            )
+            self.cnx = self._make_connector(callsign, logon_code)
         except HoppieError:
             self.cnx = None
             raise
@@ -68,7 +102,7 @@ class ConnectionManager:
         self.network_type = network_type
         self.connection_failures = 0
         self.logger.info(
-            f"Successfully connected as {callsign} to {network_type} network"
+            "Successfully connected as %s to %s network", callsign, network_type
         )
 
     def disconnect(self):
@@ -90,28 +124,51 @@ class ConnectionManager:
             return None, None
 
         try:
-            self.logger.debug("Polling for new messages")
             messages, poll_status = self.cnx.poll()
 
-            # Reset connection failures counter on successful poll
-            if self.connection_failures > 0:
+            # Reset connection failures counter on successful poll; on the
+            # healthy steady-state path this is a single falsy check
+            if self.connection_failures:
                 self.logger.debug(
-                    f"Resetting connection failures from {self.connection_failures} to 0"
+                    "Resetting connection failures from %s to 0",
+                    self.connection_failures,
                 )
-            self.connection_failures = 0
+                self.connection_failures = 0
 
             return messages, poll_status
         except HoppieError as exc:
-            self.logger.error(f"Poll error: {exc}")
+            self.logger.error("Poll error: %s", exc)
 
             # Increment connection failures counter
             self.connection_failures += 1
             self.logger.warning(
-                f"Connection failure count: {self.connection_failures}/{self.max_connection_failures}"
+                "Connection failure count: %s/%s", self.connection_failures, self.max_connection_failures
             )
 
             return None, None
 
+    def poll_async(self, on_done):
+        """Poll for new messages on a worker thread.
+
+        The blocking HTTP call runs on a single-worker executor and the
+        result is marshalled back to the wx main thread, so the GUI never
+        stalls for the network round-trip.
+
+        Args:
+            on_done: Callable invoked on the main thread with the
+                (messages, poll_status) tuple
+        """
+
+        def _run():
+            try:
+                result = self.poll()
+            except Exception as exc:
+                self.logger.error("Unexpected error during poll: %s", exc)
+                result = (None, None)
+            wx.CallAfter(on_done, result)
+
+        self._poll_executor.submit(_run)
+
     def should_attempt_reconnection(self):
         """Check if reconnection should be attempted based on failure count."""
         return (
@@ -131,26 +188,16 @@ class ConnectionManager:
             return False
 
         try:
-            self.logger.info(f"Attempting to reconnect as {self.callsign}...")
-
-            # Select the appropriate API URL based on stored network type
-            if self.network_type == "hoppie":
-                api_url = HOPPIE_API_URL
-            else:
-                api_url = SAYINTENTIONS_API_URL
-
-            self.cnx = HoppieConnector(
-                self.callsign,
-                self.logon_code,
-                url=api_url,
-            )
+            self.logger.info("Attempting to reconnect as %s...", self.callsign)
+
+            self.cnx = self._make_connector(self.callsign, self.logon_code)
 
             # Reset connection failures counter
             self.connection_failures = 0
-            self.logger.info(f"Reconnection successful for {self.callsign}")
+            self.logger.info("Reconnection successful for %s", self.callsign)
             return True
         except HoppieError as exc:
-            self.logger.error(f"Reconnection failed: {exc}")
+            self.logger.error("Reconnection failed: %s", exc)
             self.cnx = None
             return False
 
@@ -202,12 +249,6 @@ class ConnectionManager:
         if not self.cnx:
             raise HoppieError("Not connected")
 
-        # Select the appropriate API URL based on stored network type
-        if self.network_type == "hoppie":
-            api_url = HOPPIE_API_URL
-        else:
-            api_url = SAYINTENTIONS_API_URL
-
         params = {
             "logon": self.logon_code,
             "from": self.callsign,
@@ -216,13 +257,13 @@ class ConnectionManager:
             "packet": f"metar {icao}",
         }
 
-        self.logger.info(f"Requesting METAR for {icao}")
+        self.logger.info("Requesting METAR for %s", icao)
 
         try:
-            response = requests.get(api_url, params=params, timeout=15)
+            response = requests.get(self._api_url, params=params, timeout=15)
             response.raise_for_status()
         except requests.RequestException as exc:
-            self.logger.error(f"METAR request failed: {exc}")
+            self.logger.error("METAR request failed: %s", exc)
             raise HoppieError(f"METAR request failed: {exc}")
 
         body = response.text.strip()
@@ -233,14 +274,14 @@ class ConnectionManager:
             match = re.match(r"^\{server info \{(.+)\}\}$", metar_text, re.DOTALL)
             if match:
                 metar_text = match.group(1).strip()
-            self.logger.info(f"Received METAR for {icao}")
+            self.logger.info("Received METAR for %s", icao)
             return metar_text
         elif body.startswith("error "):
             error_reason = body[6:].strip()
-            self.logger.error(f"METAR request error: {error_reason}")
+            self.logger.error("METAR request error: %s", error_reason)
             raise HoppieError(f"METAR request error: {error_reason}")
         else:
-            self.logger.error(f"Unexpected METAR response: {body}")
+            self.logger.error("Unexpected METAR response: %s", body)
             raise HoppieError(f"Unexpected response: {body}")
 
     def send_atis_request(self, icao):
@@ -262,12 +303,6 @@ class ConnectionManager:
         if not self.cnx:
             raise HoppieError("Not connected")
 
-        # Select the appropriate API URL based on stored network type
-        if self.network_type == "hoppie":
-            api_url = HOPPIE_API_URL
-        else:
-            api_url = SAYINTENTIONS_API_URL
-
         params = {
             "logon": self.logon_code,
             "from": self.callsign,
@@ -276,13 +311,13 @@ class ConnectionManager:
             "packet": f"vatatis {icao}",
         }
 
-        self.logger.info(f"Requesting ATIS for {icao}")
+        self.logger.info("Requesting ATIS for %s", icao)
 
         try:
-            response = requests.get(api_url, params=params, timeout=15)
+            response = requests.get(self._api_url, params=params, timeout=15)
             response.raise_for_status()
         except requests.RequestException as exc:
-            self.logger.error(f"ATIS request failed: {exc}")
+            self.logger.error("ATIS request failed: %s", exc)
             raise HoppieError(f"ATIS request failed: {exc}")
 
         body = response.text.strip()
@@ -294,12 +329,12 @@ class ConnectionManager:
             match = re.match(r"^\{server info \{(.+)\}\}$", atis_text, re.DOTALL)
             if match:
                 atis_text = match.group(1).strip()
-            self.logger.info(f"Received ATIS for {icao}")
+            self.logger.info("Received ATIS for %s", icao)
             return atis_text
         elif body.startswith("error "):
             error_reason = body[6:].strip()
-            self.logger.error(f"ATIS request error: {error_reason}")
+            self.logger.error("ATIS request error: %s", error_reason)
             raise HoppieError(f"ATIS request error: {error_reason}")
         else:
-            self.logger.error(f"Unexpected ATIS response: {body}")
+            self.logger.error("Unexpected ATIS response: %s", body)
             raise HoppieError(f"Unexpected response: {body}")
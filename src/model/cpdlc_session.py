@@ -1,6 +1,7 @@
 """CPDLC session management for the client."""
 
 import logging
+from dataclasses import dataclass
 from typing import Optional, Callable, Tuple
 
 from hoppie_connector import CpdlcResponseRequirement as RR, HoppieError
@@ -8,9 +9,35 @@ from hoppie_connector import CpdlcResponseRequirement as RR, HoppieError
 from src.model.connection_manager import ConnectionManager
 
 
+@dataclass(frozen=True)
+class SessionStatus:
+    """Immutable point-in-time view of the CPDLC session state.
+
+    Returned by CpdlcSession.snapshot so callers that need several state
+    fields for one decision read them in a single call.
+    """
+
+    logged_on: bool
+    station: str
+    callsign: str
+
+
 class CpdlcSession:
     """Manages CPDLC session state and operations."""
 
+    # Fixed attribute layout: no per-instance __dict__, faster attribute
+    # access in the send_* hot paths
+    __slots__ = (
+        "logger",
+        "connection_manager",
+        "current_station",
+        "cpdlc_min_counter",
+        "callsign",
+        "_callsign_upper",
+        "pending_logon_min",
+        "pending_logon_station",
+    )
+
     def __init__(self, logger, connection_manager: ConnectionManager):
         """Initialize the CPDLC session.
 
@@ -23,6 +50,7 @@ class CpdlcSession:
         self.current_station = ""
         self.cpdlc_min_counter = 1
         self.callsign = ""
+        self._callsign_upper = ""
         self.pending_logon_min = None
         self.pending_logon_station = None
 
@@ -33,6 +61,8 @@ class CpdlcSession:
             callsign: The aircraft callsign
         """
         self.callsign = callsign
+        # Cached once so PDC message construction skips the case fold
+        self._callsign_upper = callsign.upper()
 
     def get_callsign(self) -> str:
         """Get the current aircraft callsign.
@@ -58,6 +88,15 @@ class CpdlcSession:
         """
         return self.current_station
 
+    def snapshot(self) -> SessionStatus:
+        """Get a consistent snapshot of the session state.
+
+        Returns:
+            SessionStatus: The logged-on flag, current station and callsign
+        """
+        station = self.current_station
+        return SessionStatus(bool(station), station, self.callsign)
+
     def logon(self, station: str) -> Tuple[bool, Optional[str]]:
         """Logon to a CPDLC station.
 
@@ -76,11 +115,11 @@ class CpdlcSession:
         # Validate station name is exactly 4 characters
         if len(station) != 4:
             self.logger.warning(
-                f"Invalid station name: {station} (must be 4 characters)"
+                "Invalid station name: %s (must be 4 characters)", station
             )
             return False, None
 
-        self.logger.info(f"Attempting to logon to station: {station}")
+        self.logger.info("Attempting to logon to station: %s", station)
         self.cpdlc_min_counter = 1
         message = "REQUEST LOGON"
 
@@ -92,7 +131,7 @@ class CpdlcSession:
                 message,
             )
         except HoppieError as exc:
-            self.logger.error(f"Failed to send logon request to {station}: {exc}")
+            self.logger.error("Failed to send logon request to %s: %s", station, exc)
             return False, str(exc)
 
         # Track pending logon for MRN validation on LOGON ACCEPTED
@@ -101,7 +140,7 @@ class CpdlcSession:
 
         # Don't set current_station yet, just increment the counter
         self.cpdlc_min_counter += 1
-        self.logger.info(f"Logon request sent to {station}")
+        self.logger.info("Logon request sent to %s", station)
         return True, message
 
     def logoff(self) -> Tuple[bool, Optional[str]]:
@@ -116,7 +155,7 @@ class CpdlcSession:
             self.logger.debug("Logoff attempted without active station or connection")
             return False, None
 
-        self.logger.info(f"Logging off from station: {self.current_station}")
+        self.logger.info("Logging off from station: %s", self.current_station)
         message = "LOGOFF"
 
         try:
@@ -128,7 +167,7 @@ class CpdlcSession:
             )
         except HoppieError as exc:
             self.logger.error(
-                f"Failed to send logoff message to {self.current_station}: {exc}"
+                "Failed to send logoff message to %s: %s", self.current_station, exc
             )
             return False, str(exc)
 
@@ -136,20 +175,9 @@ class CpdlcSession:
         previous_station = self.current_station
         self.cpdlc_min_counter += 1
         self.current_station = ""
-        self.logger.info(f"Successfully logged off from {previous_station}")
+        self.logger.info("Successfully logged off from %s", previous_station)
         return True, message
 
-    def send_logoff_message(self) -> Tuple[bool, Optional[str]]:
-        """Send a logoff message to the current station.
-
-        Alias for logoff() kept for backward compatibility.
-
-        Returns:
-            tuple: (success, message_text) where success is True if message sent successfully,
-                  and message_text is the message text that was sent (or None if failed)
-        """
-        return self.logoff()
-
     def send_altitude_change_request(
         self, altitude: str, reason: Optional[str] = None
     ) -> Tuple[bool, Optional[str]]:
@@ -170,8 +198,7 @@ class CpdlcSession:
             return False, None
 
         self.logger.info(
-            f"Requesting {altitude}"
-            + (f" due to {reason}" if reason else "")
+            "Requesting %s%s", altitude, f" due to {reason}" if reason else ""
         )
 
         message = f"REQUEST {altitude}"
@@ -186,12 +213,12 @@ class CpdlcSession:
                 message,
             )
         except HoppieError as exc:
-            self.logger.error(f"Failed to send altitude change request: {exc}")
+            self.logger.error("Failed to send altitude change request: %s", exc)
             return False, str(exc)
 
         self.cpdlc_min_counter += 1
         self.logger.debug(
-            f"Altitude change request sent, new MIN counter: {self.cpdlc_min_counter}"
+            "Altitude change request sent, new MIN counter: %s", self.cpdlc_min_counter
         )
         return True, message
 
@@ -215,11 +242,11 @@ class CpdlcSession:
 
         if self.current_station and sender != self.current_station:
             self.logger.warning(
-                f"Acknowledgement sender {sender} does not match current station {self.current_station}"
+                "Acknowledgement sender %s does not match current station %s", sender, self.current_station
             )
 
         self.logger.info(
-            f"Acknowledging message from {sender} (MIN: {min_value}) with response: {response}"
+            "Acknowledging message from %s (MIN: %s) with response: %s", sender, min_value, response
         )
 
         try:
@@ -231,7 +258,7 @@ class CpdlcSession:
                 mrn=min_value,
             )
         except HoppieError as exc:
-            self.logger.error(f"Failed to send acknowledgement to {sender}: {exc}")
+            self.logger.error("Failed to send acknowledgement to %s: %s", sender, exc)
             return False, str(exc)
 
         self.cpdlc_min_counter += 1
@@ -254,7 +281,7 @@ class CpdlcSession:
             atis_text = self.connection_manager.send_atis_request(icao)
             return True, atis_text
         except HoppieError as exc:
-            self.logger.error(f"Failed to request ATIS for {icao}: {exc}")
+            self.logger.error("Failed to request ATIS for %s: %s", icao, exc)
             return False, str(exc)
 
     def send_direct_request(
@@ -287,7 +314,7 @@ class CpdlcSession:
                 message,
             )
         except HoppieError as exc:
-            self.logger.error(f"Failed to send direct request: {exc}")
+            self.logger.error("Failed to send direct request: %s", exc)
             return False, str(exc)
 
         self.cpdlc_min_counter += 1
@@ -328,7 +355,7 @@ class CpdlcSession:
                 message,
             )
         except HoppieError as exc:
-            self.logger.error(f"Failed to send speed request: {exc}")
+            self.logger.error("Failed to send speed request: %s", exc)
             return False, str(exc)
 
         self.cpdlc_min_counter += 1
@@ -357,7 +384,7 @@ class CpdlcSession:
                 message_text,
             )
         except HoppieError as exc:
-            self.logger.error(f"Failed to send when-can-we-expect request: {exc}")
+            self.logger.error("Failed to send when-can-we-expect request: %s", exc)
             return False, str(exc)
 
         self.cpdlc_min_counter += 1
@@ -380,7 +407,7 @@ class CpdlcSession:
             metar_text = self.connection_manager.send_metar_request(icao)
             return True, metar_text
         except HoppieError as exc:
-            self.logger.error(f"Failed to request METAR for {icao}: {exc}")
+            self.logger.error("Failed to request METAR for %s: %s", icao, exc)
             return False, str(exc)
 
     def send_telex(self, recipient: str, message: str) -> Tuple[bool, Optional[str]]:
@@ -398,13 +425,13 @@ class CpdlcSession:
             self.logger.warning("Telex attempted without active connection")
             return False, None
 
-        self.logger.info(f"Sending telex to {recipient}")
-        self.logger.debug(f"Telex content: {message}")
+        self.logger.info("Sending telex to %s", recipient)
+        self.logger.debug("Telex content: %s", message)
 
         try:
             self.connection_manager.send_telex(recipient, message)
         except HoppieError as exc:
-            self.logger.error(f"Failed to send telex to {recipient}: {exc}")
+            self.logger.error("Failed to send telex to %s: %s", recipient, exc)
             return False, str(exc)
 
         return True, message
@@ -419,7 +446,7 @@ class CpdlcSession:
         # Validate station name is exactly 4 characters
         if len(station) != 4:
             self.logger.warning(
-                f"Invalid station name in LOGON ACCEPTED: {station} (must be 4 characters)"
+                "Invalid station name in LOGON ACCEPTED: %s (must be 4 characters)", station
             )
             return
 
@@ -427,11 +454,11 @@ class CpdlcSession:
         if self.pending_logon_min is not None and mrn is not None:
             if mrn != self.pending_logon_min:
                 self.logger.warning(
-                    f"LOGON ACCEPTED MRN {mrn} does not match pending logon MIN {self.pending_logon_min}, ignoring"
+                    "LOGON ACCEPTED MRN %s does not match pending logon MIN %s, ignoring", mrn, self.pending_logon_min
                 )
                 return
 
-        self.logger.info(f"Logon accepted by station: {station}")
+        self.logger.info("Logon accepted by station: %s", station)
         self.current_station = station
         self.pending_logon_min = None
         self.pending_logon_station = None
@@ -443,11 +470,11 @@ class CpdlcSession:
             station: The station that sent the logoff
         """
         if self.current_station == station:
-            self.logger.info(f"Received LOGOFF from station: {station}")
+            self.logger.info("Received LOGOFF from station: %s", station)
             self.current_station = ""
         else:
             self.logger.warning(
-                f"Received LOGOFF from {station} but current station is {self.current_station}"
+                "Received LOGOFF from %s but current station is %s", station, self.current_station
             )
 
     def send_pdc_request(
@@ -478,15 +505,30 @@ class CpdlcSession:
             return False, None
 
         self.logger.info(
-            f"Requesting PDC from {origin_icao} to {destination_icao} with aircraft {aircraft_code}"
+            "Requesting PDC from %s to %s with aircraft %s", origin_icao, destination_icao, aircraft_code
         )
 
-        message = f"Request predep clearance {self.callsign} {aircraft_code} to {destination_icao} at {origin_icao} stand {stand_designator} atis {atis_code}".upper()
+        # Uppercase the individual fields (usually already upper-case ICAO
+        # codes) instead of case-folding the whole assembled string
+        message = (
+            "REQUEST PREDEP CLEARANCE "
+            + self._callsign_upper
+            + " "
+            + aircraft_code.upper()
+            + " TO "
+            + destination_icao.upper()
+            + " AT "
+            + origin_icao.upper()
+            + " STAND "
+            + stand_designator.upper()
+            + " ATIS "
+            + atis_code.upper()
+        )
 
         try:
             self.connection_manager.send_telex(origin_icao, message)
         except HoppieError as exc:
-            self.logger.error(f"Failed to send PDC request to {origin_icao}: {exc}")
+            self.logger.error("Failed to send PDC request to %s: %s", origin_icao, exc)
             return False, str(exc)
 
         return True, message
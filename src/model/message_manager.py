@@ -15,10 +15,25 @@ from src.utils.message_formatting import (
     format_message_text,
 )
 
+# Shared default for senders with no acknowledgements yet, so the lookup
+# never allocates a set just to probe it
+_EMPTY_SET = frozenset()
+
 
 class MessageManager:
     """Manages CPDLC messages and their state."""
 
+    # Valid response options per response requirement. Built once at class
+    # definition; the tuples are shared, immutable instances.
+    _RESPONSES = {
+        RR.W_U: ("WILCO", "UNABLE", "STANDBY"),
+        RR.A_N: ("AFFIRM", "NEGATIVE", "STANDBY"),
+        RR.R: ("ROGER", "STANDBY"),
+        RR.YES: ("YES", "NO"),
+        # N means "no response required" (used on response messages)
+        RR.NO: (),
+    }
+
     def __init__(self, logger):
         """Initialize the message manager.
 
@@ -28,7 +43,20 @@ class MessageManager:
         self.logger = logger
         self.message_id_counter = 0
         self.message_log = {}  # Maps message_id to message object
-        self.acknowledged_messages = set()  # Set of (sender, message_id) tuples
+        # Maps sender name to the set of acknowledged MINs from that
+        # station; avoids building a (sender, min) tuple for every lookup
+        self.acknowledged_messages = {}
+        # Maps message_id to a kind tag ("cpdlc", "hoppie" or "custom") so
+        # callers can branch on a dict read instead of isinstance checks
+        self.message_kinds = {}
+        # Memoized (needs_ack, responses) per message_id; cleared whenever
+        # an acknowledgement changes the answer
+        self._ack_cache = {}
+        # Memoized formatting results per message_id. Messages are
+        # immutable once logged and IDs are never reused, so these never
+        # need invalidation.
+        self._display_cache = {}
+        self._detail_cache = {}
 
     def add_message(self, message: HoppieMessage) -> int:
         """Add a HoppieMessage to the message log.
@@ -46,13 +74,20 @@ class MessageManager:
         message_id = self.message_id_counter
         self.message_id_counter += 1
         self.message_log[message_id] = message
+        self.message_kinds[message_id] = (
+            "cpdlc" if isinstance(message, CpdlcMessage) else "hoppie"
+        )
 
-        # Get and clean the raw content for logging
+        # Clean the raw content once and pre-populate the formatting
+        # caches, so the first list refresh and detail view after a poll
+        # hit warm entries instead of formatting on the GUI thread
+        sender = message.get_from_name()
         raw_content = message.get_packet_content()
         clean_content = extract_message_content(raw_content)
-        self.logger.debug(
-            f"Added message from {message.get_from_name()}: {clean_content}"
-        )
+        self._display_cache[message_id] = (sender, format_list_text(clean_content))
+        self._detail_cache[message_id] = format_message_text(clean_content)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Added message from {sender}: {clean_content}")
 
         return message_id
 
@@ -72,8 +107,19 @@ class MessageManager:
         # Store as a simple string
         message_text = f"{sender}: {text}" if sender else text
         self.message_log[message_id] = message_text
+        self.message_kinds[message_id] = "custom"
+        # Pre-populate the formatting caches with the same split the
+        # getters would perform
+        shown_sender, sep, shown_text = message_text.partition(": ")
+        if sep:
+            self._display_cache[message_id] = (shown_sender, shown_text)
+            self._detail_cache[message_id] = shown_text
+        else:
+            self._display_cache[message_id] = ("SYSTEM", message_text)
+            self._detail_cache[message_id] = message_text
 
-        self.logger.debug(f"Added custom message: {message_text}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Added custom message: {message_text}")
         return message_id
 
     def get_message(self, message_id: int) -> Optional[Any]:
@@ -87,6 +133,17 @@ class MessageManager:
         """
         return self.message_log.get(message_id)
 
+    def get_kind(self, message_id: int) -> str:
+        """Get the kind tag recorded for a message.
+
+        Args:
+            message_id: The message ID
+
+        Returns:
+            str: "cpdlc", "hoppie" or "custom", or "" if not found
+        """
+        return self.message_kinds.get(message_id, "")
+
     def get_message_display_text(self, message_id: int) -> Tuple[str, str]:
         """Get formatted display text for a message.
 
@@ -96,27 +153,35 @@ class MessageManager:
         Returns:
             tuple: (sender, display_text) or ("", "") if not found
         """
+        cached = self._display_cache.get(message_id)
+        if cached is not None:
+            return cached
+
         message = self.message_log.get(message_id)
         if not message:
             return "", ""
 
-        if isinstance(message, HoppieMessage):
-            # For HoppieMessage objects
+        # Branch on the recorded kind tag rather than isinstance checks
+        kind = self.message_kinds.get(message_id, "")
+        if kind == "custom":
+            sender, sep, text = message.partition(": ")
+            if sep:
+                result = sender, text
+            else:
+                result = "SYSTEM", message
+        elif kind:
+            # For HoppieMessage objects ("cpdlc" or "hoppie")
             sender = message.get_from_name()
             raw_content = message.get_packet_content()
             clean_content = extract_message_content(raw_content)
             display_text = format_list_text(clean_content)
-            return sender, display_text
-        elif isinstance(message, str):
-            # For custom messages
-            if ": " in message:
-                sender, text = message.split(": ", 1)
-                return sender, text
-            else:
-                return "SYSTEM", message
+            result = sender, display_text
         else:
             return "", ""
 
+        self._display_cache[message_id] = result
+        return result
+
     def get_message_detail_text(self, message_id: int) -> str:
         """Get detailed text for a message.
 
@@ -126,25 +191,30 @@ class MessageManager:
         Returns:
             str: Formatted message text for detailed view
         """
+        cached = self._detail_cache.get(message_id)
+        if cached is not None:
+            return cached
+
         message = self.message_log.get(message_id)
         if not message:
             return ""
 
-        if isinstance(message, HoppieMessage):
-            # For HoppieMessage objects
+        # Branch on the recorded kind tag rather than isinstance checks
+        kind = self.message_kinds.get(message_id, "")
+        if kind == "custom":
+            _, sep, text = message.partition(": ")
+            result = text if sep else message
+        elif kind:
+            # For HoppieMessage objects ("cpdlc" or "hoppie")
             raw_content = message.get_packet_content()
             clean_content = extract_message_content(raw_content)
-            return format_message_text(clean_content)
-        elif isinstance(message, str):
-            # For custom messages
-            if ": " in message:
-                _, text = message.split(": ", 1)
-                return text
-            else:
-                return message
+            result = format_message_text(clean_content)
         else:
             return ""
 
+        self._detail_cache[message_id] = result
+        return result
+
     def mark_acknowledged(self, message: CpdlcMessage):
         """Mark a message as acknowledged.
 
@@ -156,11 +226,42 @@ class MessageManager:
 
         sender = message.get_from_name()
         min_value = message.get_min()
-        message_key = (sender, min_value)
-        self.acknowledged_messages.add(message_key)
-        self.logger.debug(f"Marked message as acknowledged: {message_key}")
+        self.acknowledged_messages.setdefault(sender, set()).add(min_value)
+        # The acknowledgement changes needs_acknowledgement answers
+        self._ack_cache.clear()
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                f"Marked message as acknowledged: {(sender, min_value)}"
+            )
+
+    def get_ack_info(self, message_id: int):
+        """Get a message together with its acknowledgement options.
+
+        Combines get_message and needs_acknowledgement into one lookup and
+        memoizes the result, so the right-click path costs one dict read
+        per repeat query. The responses tuple is a stable instance,
+        suitable for keying menu caches.
+
+        Args:
+            message_id: The message ID
 
-    def needs_acknowledgement(self, message: HoppieMessage) -> Tuple[bool, List[str]]:
+        Returns:
+            tuple: (message, needs_ack, responses); message is None if the
+                ID is unknown
+        """
+        message = self.message_log.get(message_id)
+        if message is None:
+            return None, False, ()
+
+        cached = self._ack_cache.get(message_id)
+        if cached is None:
+            cached = self.needs_acknowledgement(message)
+            self._ack_cache[message_id] = cached
+        return message, cached[0], cached[1]
+
+    def needs_acknowledgement(
+        self, message: HoppieMessage
+    ) -> Tuple[bool, Tuple[str, ...]]:
         """Check if a message needs acknowledgement and get valid responses.
 
         Args:
@@ -169,51 +270,24 @@ class MessageManager:
         Returns:
             tuple: (needs_ack, responses)
         """
-        if isinstance(message, CpdlcMessage):
-            # Create a message identifier tuple
-            message_key = (message.get_from_name(), message.get_min())
-
-            # Check if this message has already been acknowledged
-            if message_key not in self.acknowledged_messages:
-                responses = self._get_cpdlc_responses(message)
-                if responses:
-                    self.logger.debug("Message needs acknowledgement.")
-                    return True, responses
-
-        self.logger.debug("Message does not need acknowledgement.")
-        return False, []
+        # Non-CPDLC traffic (telex, system text) never needs a response
+        if not isinstance(message, CpdlcMessage):
+            return False, ()
 
-    def _get_cpdlc_responses(self, message: CpdlcMessage) -> List[str]:
-        """Get valid response options for a CPDLC message.
+        # Check the response requirement before touching sender or MIN:
+        # messages that require no response bail out without building a
+        # key or probing the acknowledgement sets
+        responses = self._RESPONSES.get(message.get_rr())
+        if not responses:
+            self.logger.debug("Message does not need acknowledgement.")
+            return False, ()
 
-        Args:
-            message: The CPDLC message
-
-        Returns:
-            list: Valid response strings
-        """
-        responses = []
-        rr = message.get_rr()
-        if rr == RR.W_U:
-            responses.append("WILCO")
-            responses.append("UNABLE")
-            responses.append("STANDBY")
-        elif rr == RR.A_N:
-            responses.append("AFFIRM")
-            responses.append("NEGATIVE")
-            responses.append("STANDBY")
-        elif rr == RR.R:
-            responses.append("ROGER")
-            responses.append("STANDBY")
-        elif rr == RR.YES:
-            responses.append("YES")
-            responses.append("NO")
-        elif rr == RR.NO:
-            # N means "no response required" (used on response messages)
-            return []
-        else:
-            self.logger.debug("No responses needed.")
-            return []
+        # Check if this message has already been acknowledged
+        sender = message.get_from_name()
+        min_value = message.get_min()
+        if min_value in self.acknowledged_messages.get(sender, _EMPTY_SET):
+            self.logger.debug("Message does not need acknowledgement.")
+            return False, ()
 
-        self.logger.debug(f"Valid responses: {responses}")
-        return responses
+        self.logger.debug("Message needs acknowledgement.")
+        return True, responses
@@ -2,19 +2,27 @@
 
 import re
 
+# Metadata prefix on CPDLC payloads, compiled once. Handles both formats:
+# 1. Standard format: /data2/25//WU/ACTUAL MESSAGE HERE
+# 2. Logon format: /data2/19/1/NE/LOGON ACCEPTED
+_META_RE = re.compile(r"^/data\d+/\d+(?:/\d+/\w+/|//\w+/)")
+
+# Single-character translation for the compact list display; translate
+# runs in one C-level pass with no substring search state
+_AT_TO_SPACE = str.maketrans({"@": " "})
+
 
 def extract_message_content(raw_content):
     """Remove metadata prefix from CPDLC message content."""
     if not raw_content or not isinstance(raw_content, str):
         return raw_content
 
-    # Handle multiple possible formats:
-    # 1. Standard format: /data2/25//WU/ACTUAL MESSAGE HERE
-    # 2. Logon format: /data2/19/1/NE/LOGON ACCEPTED
-    pattern = r"^/data\d+/\d+(?:/\d+/\w+/|//\w+/)"
+    # Only CPDLC payloads carry the /data prefix; telex and system text
+    # can skip the regex entirely
+    if not raw_content.startswith("/data"):
+        return raw_content
 
-    cleaned_content = re.sub(pattern, "", raw_content)
-    return cleaned_content
+    return _META_RE.sub("", raw_content)
 
 
 def format_list_text(text):
@@ -27,7 +35,7 @@ def format_list_text(text):
     # Remove underscores (formatting artifacts from Hoppie messages)
     text = text.replace("_", "")
     # Replace @ with spaces for a compact list display
-    return text.replace("@", " ")
+    return text.translate(_AT_TO_SPACE)
 
 
 def format_message_text(text):
@@ -40,36 +48,45 @@ def format_message_text(text):
         text = text.replace("@@", "N/A")
         # Remove underscores (formatting artifacts from Hoppie messages)
         text = text.replace("_", "")
-        # Split by @ characters
-        segments = text.split("@")
 
-        # Process segments for better formatting
+        # Walk the @-separated segments with str.find instead of split,
+        # so each segment is sliced exactly once (no intermediate list of
+        # unstripped copies)
         formatted_lines = []
-        current_line = segments[0].strip() if segments else ""
-
-        for i in range(1, len(segments)):
-            segment = segments[i].strip()
-
-            # Skip empty segments
-            if not segment:
-                continue
-
-            # Handle punctuation
-            if current_line and current_line[-1] in ".,":
-                # If current line ends with punctuation, it's complete
-                formatted_lines.append(current_line)
+        current_line = ""
+        length = len(text)
+        pos = 0
+        first = True
+        while pos <= length:
+            idx = text.find("@", pos)
+            if idx == -1:
+                idx = length
+            segment = text[pos:idx].strip()
+            pos = idx + 1
+
+            if first:
                 current_line = segment
-            elif segment and segment[0] in ".,":
-                # If segment starts with punctuation, append it to current line
-                current_line += segment
-                formatted_lines.append(current_line)
-                current_line = ""
-            else:
-                # Normal case - append segments with a space
-                if current_line:
-                    # Only add a space if there's existing content
+                first = False
+            elif segment:
+                # Handle punctuation
+                if current_line and current_line[-1] in ".,":
+                    # If current line ends with punctuation, it's complete
                     formatted_lines.append(current_line)
-                current_line = segment
+                    current_line = segment
+                elif segment[0] in ".,":
+                    # If segment starts with punctuation, append it to
+                    # the current line
+                    current_line += segment
+                    formatted_lines.append(current_line)
+                    current_line = ""
+                else:
+                    # Normal case - start a new line
+                    if current_line:
+                        formatted_lines.append(current_line)
+                    current_line = segment
+
+            if idx == length:
+                break
 
         # Add the last line if it has content
         if current_line:
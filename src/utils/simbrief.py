@@ -1,18 +1,104 @@
 """SimBrief API integration for fetching Operational Flight Plan (OFP) data."""
 
+import os
+import threading
+import time
 import requests
 import json
 import logging
-from typing import Dict, Optional, Any
+from typing import Any, Callable, Dict, Optional
+
+from src.config import get_user_data_dir
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Shared session with a small connection pool, so repeated fetches reuse
+# the TCP/TLS connection instead of paying a new handshake per request
+_session = requests.Session()
+_session.mount(
+    "https://",
+    requests.adapters.HTTPAdapter(pool_connections=2, pool_maxsize=4),
+)
+
+# Disk cache for the most recently fetched OFP, so reopening a dialog
+# shortly after a fetch doesn't pay another network round-trip
+_OFP_CACHE_FILENAME = "simbrief_ofp.json"
+_OFP_CACHE_TTL = 600  # seconds
+
+# In-memory cache shared by all dialogs in the process: {userid: (ts, ofp)}.
+# Checked before the disk cache so back-to-back dialog opens skip even the
+# file read and JSON parse.
+_MEMORY_CACHE_TTL = 120  # seconds
+_memory_cache: Dict[str, tuple] = {}
+_memory_cache_lock = threading.Lock()
+
+
+def _ofp_cache_path() -> str:
+    """Return the path of the on-disk OFP cache file."""
+    return os.path.join(get_user_data_dir(), _OFP_CACHE_FILENAME)
+
+
+def _read_cached_ofp(user_id: str) -> Optional[Dict[str, Any]]:
+    """Return the cached OFP for user_id if present and fresh, else None."""
+    try:
+        with open(_ofp_cache_path(), "r") as f:
+            entry = json.load(f)
+    except (IOError, ValueError):
+        return None
+
+    if entry.get("userid") != user_id:
+        return None
+    if time.time() - entry.get("fetched_at", 0) > _OFP_CACHE_TTL:
+        return None
+    return entry.get("ofp")
+
+
+def _write_cached_ofp(user_id: str, ofp_data: Dict[str, Any]) -> None:
+    """Persist the fetched OFP to the on-disk cache (best effort)."""
+    entry = {"fetched_at": time.time(), "userid": user_id, "ofp": ofp_data}
+    try:
+        with open(_ofp_cache_path(), "w") as f:
+            json.dump(entry, f)
+    except (IOError, TypeError) as e:
+        logger.debug(f"Could not write OFP cache: {e}")
+
+
+# Validators from the last successful fetch per userid, so refetches can
+# use a conditional GET and short-circuit on HTTP 304: {uid: (headers, data)}
+_conditional_cache: Dict[str, tuple] = {}
+
+
+# Pre-split OFP field paths shared by the dialogs, so callers never build
+# throwaway tuples (or default dicts) per lookup
+CALLSIGN_PATH = ("atc", "callsign")
+ORIGIN_ICAO_PATH = ("origin", "icao_code")
+DESTINATION_ICAO_PATH = ("destination", "icao_code")
+AIRCRAFT_ICAO_PATH = ("aircraft", "icao_code")
+
+
+def dig(data: Any, path: tuple) -> str:
+    """Walk a nested dict along `path`, returning "" on any miss."""
+    for key in path:
+        data = data.get(key) if isinstance(data, dict) else None
+        if data is None:
+            return ""
+    return data
+
 
 class SimBriefAPI:
     """Interface for the SimBrief API to fetch flight plan data."""
 
     BASE_URL = "https://www.simbrief.com/api/xml.fetcher.php"
 
+    # Fail fast rather than hanging a fetch on an unresponsive server:
+    # 3s to connect, 5s to read
+    TIMEOUT = (3, 5)
+
     @staticmethod
     def fetch_ofp(user_id: str, format: str = "json") -> Optional[Dict[str, Any]]:
         """Fetch the latest OFP data for a given SimBrief user ID."""
@@ -23,21 +109,51 @@ class SimBriefAPI:
 
         params = {"userid": user_id, "json": 1 if format.lower() == "json" else 0}
 
+        headers = {}
+        cached = _conditional_cache.get(user_id)
+        if cached is not None:
+            headers = cached[0]
+
         try:
             logger.info(f"Fetching SimBrief OFP for user ID: {user_id}")
-            response = requests.get(
+            response = _session.get(
                 SimBriefAPI.BASE_URL,
                 params=params,
-                timeout=10,  # Add timeout to prevent hanging
+                headers=headers,
+                timeout=SimBriefAPI.TIMEOUT,
             )
+
+            # Unchanged since last fetch: reuse the previously parsed OFP
+            if response.status_code == 304 and cached is not None:
+                logger.debug("SimBrief OFP unchanged (HTTP 304)")
+                return cached[1]
+
             response.raise_for_status()  # Raise exception for HTTP errors
 
             if format.lower() == "json":
-                data = response.json()
+                # OFP payloads run to hundreds of kilobytes; orjson parses
+                # them noticeably faster than the stdlib. Fall back to
+                # response.json() when orjson is missing.
+                if orjson:
+                    data = orjson.loads(response.content)
+                else:
+                    data = response.json()
                 # Validate response contains expected data
                 if not data or not isinstance(data, dict):
                     logger.error("Invalid response format from SimBrief API")
                     return None
+
+                # Remember the response validators for conditional refetches
+                validators = {}
+                etag = response.headers.get("ETag")
+                if etag:
+                    validators["If-None-Match"] = etag
+                last_modified = response.headers.get("Last-Modified")
+                if last_modified:
+                    validators["If-Modified-Since"] = last_modified
+                if validators:
+                    _conditional_cache[user_id] = (validators, data)
+
                 return data
             else:
                 # Return XML as string if not requesting JSON
@@ -61,5 +177,53 @@ class SimBriefAPI:
 
 
 def get_latest_ofp(user_id: str) -> Optional[Dict[str, Any]]:
-    """Fetch the latest OFP for a SimBrief user."""
-    return SimBriefAPI.fetch_ofp(user_id)
+    """Fetch the latest OFP for a SimBrief user.
+
+    Returns a recently cached OFP when available to keep dialog opens
+    fast; otherwise fetches from the SimBrief API and refreshes the cache.
+    """
+    with _memory_cache_lock:
+        entry = _memory_cache.get(user_id)
+    if entry is not None and time.time() - entry[0] <= _MEMORY_CACHE_TTL:
+        logger.debug(f"Using in-memory SimBrief OFP for user ID: {user_id}")
+        return entry[1]
+
+    cached = _read_cached_ofp(user_id)
+    if cached is not None:
+        logger.debug(f"Using cached SimBrief OFP for user ID: {user_id}")
+        with _memory_cache_lock:
+            _memory_cache[user_id] = (time.time(), cached)
+        return cached
+
+    ofp_data = SimBriefAPI.fetch_ofp(user_id)
+    if isinstance(ofp_data, dict):
+        with _memory_cache_lock:
+            _memory_cache[user_id] = (time.time(), ofp_data)
+        _write_cached_ofp(user_id, ofp_data)
+    return ofp_data
+
+
+def fetch_ofp_async(
+    user_id: str, on_done: Callable[[Optional[Dict[str, Any]]], None]
+) -> threading.Thread:
+    """Fetch the latest OFP on a background thread.
+
+    Runs get_latest_ofp off the calling thread so GUI code never blocks on
+    the HTTP round-trip. ``on_done`` is invoked from the worker thread with
+    the OFP dict, or None on any failure; GUI callers should marshal back
+    to the main thread themselves (e.g. via wx.CallAfter).
+    """
+
+    def _worker():
+        try:
+            result = get_latest_ofp(user_id)
+        except Exception as e:
+            logger.error(f"Error fetching SimBrief OFP: {str(e)}")
+            result = None
+        on_done(result)
+
+    thread = threading.Thread(
+        target=_worker, name="simbrief-ofp-fetch", daemon=True
+    )
+    thread.start()
+    return thread
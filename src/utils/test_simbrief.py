@@ -12,6 +12,11 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../.
 from src.utils.simbrief import get_latest_ofp
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def test_simbrief_api():
     """Test SimBrief API with sample user ID and display flight information."""
@@ -43,8 +48,14 @@ def test_simbrief_api():
             output_file = os.path.join(
                 os.path.dirname(__file__), "latest_simbrief_ofp.json"
             )
-            with open(output_file, "w") as f:
-                json.dump(ofp_data, f, indent=2)
+            # orjson serializes the whole OFP in one C pass and the bytes
+            # are written in a single call; fall back to the stdlib
+            if orjson:
+                with open(output_file, "wb") as f:
+                    f.write(orjson.dumps(ofp_data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(output_file, "w") as f:
+                    json.dump(ofp_data, f, indent=2)
             logging.info(f"\nFull OFP data saved to '{output_file}'")
             return True
         else:
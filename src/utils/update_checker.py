@@ -1,13 +1,73 @@
 """Update checker for the Sim-CPDLC application."""
 
+import atexit
+import functools
+import json
 import logging
-import threading
+import os
+import time
 import webbrowser
-import wx
-import requests
-from packaging import version
+from concurrent.futures import ThreadPoolExecutor
 
-from src.config import APP_VERSION, GITHUB_URL
+from src.config import APP_VERSION, GITHUB_URL, get_user_data_dir
+
+# wx, requests and packaging are imported inside the functions that use
+# them, so tooling that imports this module headlessly (or never checks
+# for updates) doesn't pay for loading them
+
+
+@functools.lru_cache(maxsize=1)
+def _get_session():
+    """Build the pooled HTTP session on first use.
+
+    Manual and automatic update checks reuse the same TLS connection to
+    the GitHub API through a small shared pool.
+    """
+    import requests
+
+    session = requests.Session()
+    session.mount(
+        "https://",
+        requests.adapters.HTTPAdapter(pool_connections=2, pool_maxsize=4),
+    )
+    return session
+
+
+# One long-lived worker serves all background checks, so repeated checks
+# enqueue onto an existing thread instead of spawning a new one each time
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="update-check")
+atexit.register(_executor.shutdown, wait=False)
+
+# Persisted result of the last release lookup. Within the TTL the check
+# is answered from disk with no network call at all; after that an ETag
+# conditional request lets GitHub answer 304 with a ~200-byte response
+# instead of the full release JSON.
+_UPDATE_CACHE_FILENAME = "update_cache.json"
+_UPDATE_CACHE_TTL = 6 * 3600  # seconds
+
+
+def _update_cache_path():
+    """Return the path of the on-disk update-check cache file."""
+    return os.path.join(get_user_data_dir(), _UPDATE_CACHE_FILENAME)
+
+
+def _read_update_cache():
+    """Return the cached update-check entry, or None if absent/invalid."""
+    try:
+        with open(_update_cache_path(), "r") as f:
+            entry = json.load(f)
+    except (IOError, ValueError):
+        return None
+    return entry if isinstance(entry, dict) else None
+
+
+def _write_update_cache(entry):
+    """Persist the update-check entry to disk (best effort)."""
+    try:
+        with open(_update_cache_path(), "w") as f:
+            json.dump(entry, f)
+    except (IOError, TypeError):
+        pass
 
 
 class UpdateChecker:
@@ -31,16 +91,16 @@ class UpdateChecker:
             auto_check: If True, check in background thread and only show dialog if update available
         """
         if auto_check:
-            # Run in background thread to avoid blocking the UI
-            thread = threading.Thread(target=self._check_in_background)
-            thread.daemon = True
-            thread.start()
+            # Run on the shared background worker to avoid blocking the UI
+            _executor.submit(self._check_in_background)
         else:
             # Run synchronously and show result dialog
             self._check_and_show_result()
 
     def _check_in_background(self):
         """Check for updates in a background thread."""
+        import wx
+
         try:
             latest_version, release_url = self._get_latest_version()
             if latest_version and self._is_newer_version(latest_version):
@@ -52,6 +112,8 @@ class UpdateChecker:
 
     def _check_and_show_result(self):
         """Check for updates and show result dialog."""
+        import wx
+
         try:
             latest_version, release_url = self._get_latest_version()
             if latest_version:
@@ -84,6 +146,17 @@ class UpdateChecker:
             tuple: (version_string, release_url) or (None, None) if error
         """
         try:
+            # Fresh enough: answer from the on-disk cache with no network
+            cached = _read_update_cache()
+            now = time.time()
+            if (
+                cached
+                and cached.get("version_str")
+                and now - cached.get("last_check_ts", 0) < _UPDATE_CACHE_TTL
+            ):
+                self.logger.debug("Using cached update-check result")
+                return cached["version_str"], cached.get("html_url", "")
+
             # Extract username and repo name from GitHub URL
             # URL format: https://github.com/username/repo
             parts = GITHUB_URL.strip("/").split("/")
@@ -94,7 +167,18 @@ class UpdateChecker:
             api_url = f"https://api.github.com/repos/{username}/{repo}/releases/latest"
             self.logger.debug(f"Checking for updates at: {api_url}")
 
-            response = requests.get(api_url, timeout=5)
+            headers = {}
+            if cached and cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            response = _get_session().get(api_url, headers=headers, timeout=5)
+
+            # Release unchanged since the cached check: just bump the
+            # timestamp and skip the JSON parse
+            if response.status_code == 304 and cached:
+                cached["last_check_ts"] = now
+                _write_update_cache(cached)
+                return cached.get("version_str"), cached.get("html_url", "")
+
             response.raise_for_status()
 
             data = response.json()
@@ -104,6 +188,15 @@ class UpdateChecker:
             # Remove 'v' prefix if present
             version_str = tag_name.lstrip("v")
 
+            _write_update_cache(
+                {
+                    "etag": response.headers.get("ETag", ""),
+                    "last_check_ts": now,
+                    "version_str": version_str,
+                    "html_url": html_url,
+                }
+            )
+
             return version_str, html_url
         except Exception as e:
             self.logger.error(f"Error getting latest version: {e}")
@@ -119,6 +212,8 @@ class UpdateChecker:
             bool: True if latest_version is newer
         """
         try:
+            from packaging import version
+
             return version.parse(latest_version) > version.parse(self.current_version)
         except Exception as e:
             self.logger.error(f"Error comparing versions: {e}")
@@ -131,6 +226,8 @@ class UpdateChecker:
             latest_version: The latest version string
             release_url: URL to the latest release
         """
+        import wx
+
         result = wx.MessageBox(
             f"A new version of Sim-CPDLC is available!\n\n"
             f"Current version: {self.current_version}\n"
@@ -6,94 +6,148 @@ This script updates all version numbers in the version_info.txt file and sim-cpd
 It can be used manually or as part of a GitHub Actions workflow.
 """
 
+import argparse
+import functools
 import re
 import sys
-import argparse
 from pathlib import Path
 
-
+# Patterns compiled once at import; each update_* function reuses them
+# instead of re-feeding string patterns through re's cache. They are
+# bytes patterns: the files are read and written in binary mode, since
+# every pattern and replacement is pure ASCII and decoding the whole
+# file just to re-encode it buys nothing.
+# Single alternation covering all four version_info.txt fields, so one
+# scan of the file replaces four
+_VERSION_INFO_RE = re.compile(
+    rb"(filevers|prodvers)=\(\d+,\s*\d+,\s*\d+,\s*\d+\)"
+    rb"|StringStruct\(u'(FileVersion|ProductVersion)',\s*u'[\d.]+'\)"
+)
+# Canonical forms of the values currently in version_info.txt; when all
+# four are found, the update degrades to plain literal replacements.
+# Each field gets its own pattern: the values are not guaranteed to
+# agree with each other.
+_OLD_FILEVERS_RE = re.compile(rb"filevers=(\(\d+, \d+, \d+, \d+\))")
+_OLD_PRODVERS_RE = re.compile(rb"prodvers=(\(\d+, \d+, \d+, \d+\))")
+_OLD_FILEVERSION_RE = re.compile(rb"StringStruct\(u'FileVersion', u'([\d.]+)'\)")
+_OLD_PRODUCTVERSION_RE = re.compile(
+    rb"StringStruct\(u'ProductVersion', u'([\d.]+)'\)"
+)
+_ISS_VERSION_RE = re.compile(rb'#define MyAppVersion "[\d.]+"')
+# Version-string grammar (text pattern: the CLI argument is str)
+_VER_RE = re.compile(r"(\d+)\.(\d+)\.(\d+)(?:\.(\d+))?")
+_CONFIG_VERSION_RE = re.compile(rb'APP_VERSION = "[\d.]+"')
+
+
+@functools.lru_cache(maxsize=32)
 def parse_version(version_str):
     """
-    Parse a version string into a tuple of integers.
-    Supports formats like '1.2.3' or '1.2.3.4'.
+    Parse a version string into a tuple of four integers.
+    Accepts '1.2.3' or '1.2.3.4' and raises ValueError on anything else.
+    Cached so repeated calls with the same string (dry-run plus real
+    run, loops in CI) parse once.
     """
-    parts = version_str.split(".")
-    # Convert all parts to integers
-    version_tuple = tuple(int(part) for part in parts)
-
-    # Ensure we have at least 3 components
-    if len(version_tuple) < 3:
-        version_tuple = version_tuple + (0,) * (3 - len(version_tuple))
-
-    # For file version, ensure we have exactly 4 components
-    if len(version_tuple) < 4:
-        version_tuple = version_tuple + (0,) * (4 - len(version_tuple))
-
-    return version_tuple
+    match = _VER_RE.fullmatch(version_str)
+    if not match:
+        raise ValueError(f"Invalid version string: {version_str!r}")
+    major, minor, patch, build = match.groups(default="0")
+    return (int(major), int(minor), int(patch), int(build))
 
 
 def format_version_string(version_tuple):
     """
     Format a version tuple as a string with 3 components (e.g., '1.2.3').
     """
-    # Use only the first 3 components for string representation
-    return ".".join(str(part) for part in version_tuple[:3])
+    # Use only the first 3 components for string representation; direct
+    # indexing skips the tuple slice and generator a join would need
+    return f"{version_tuple[0]}.{version_tuple[1]}.{version_tuple[2]}"
 
 
-def update_version_info(file_path, new_version):
+def update_version_info(file_path, version_tuple, version_string):
     """
     Update all version numbers in the version_info.txt file.
 
     Args:
         file_path: Path to the version_info.txt file
-        new_version: New version string (e.g., '1.2.3')
+        version_tuple: Parsed version as a 4-tuple of ints
+        version_string: Three-component version string (e.g., '1.2.3')
 
     Returns:
         bool: True if file was updated, False otherwise
     """
     try:
         # Read the current content
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
+        content = Path(file_path).read_bytes()
+    except OSError as e:
+        print(f"Error updating version: {e}", file=sys.stderr)
+        return False
 
-        # Parse the new version
-        version_tuple = parse_version(new_version)
-        version_string = format_version_string(version_tuple)
+    # Cheap substring prefilter: no version fields, nothing to do
+    if b"filevers=" not in content and b"StringStruct" not in content:
+        return True
 
-        # Update filevers and prodvers tuples (all 4 components)
-        content = re.sub(
-            r"filevers=\(\d+,\s*\d+,\s*\d+,\s*\d+\)",
-            f"filevers={version_tuple}",
-            content,
-        )
-        content = re.sub(
-            r"prodvers=\(\d+,\s*\d+,\s*\d+,\s*\d+\)",
-            f"prodvers={version_tuple}",
-            content,
+    # Format the replacement values once, outside the substitution
+    # machinery; direct indexing is cheaper than the tuple repr
+    major, minor, patch, build = version_tuple
+    tuple_repl = f"({major}, {minor}, {patch}, {build})".encode()
+    string_repl = version_string.encode()
+
+    # Fast path: the file stores the old values verbatim, so once they
+    # are known all four updates become fixed-string replacements served
+    # by the C-level substring search. Each field is located with its
+    # own search — the current values may disagree with one another —
+    # and a found anchor guarantees its literal replacement hits, so the
+    # regex fallback is only needed when a field is missing entirely.
+    new_content = None
+    filevers_match = _OLD_FILEVERS_RE.search(content)
+    prodvers_match = _OLD_PRODVERS_RE.search(content)
+    filever_str_match = _OLD_FILEVERSION_RE.search(content)
+    prodver_str_match = _OLD_PRODUCTVERSION_RE.search(content)
+    if filevers_match and prodvers_match and filever_str_match and prodver_str_match:
+        new_content = (
+            content.replace(
+                b"filevers=" + filevers_match.group(1),
+                b"filevers=" + tuple_repl,
+            )
+            .replace(
+                b"prodvers=" + prodvers_match.group(1),
+                b"prodvers=" + tuple_repl,
+            )
+            .replace(
+                b"'FileVersion', u'" + filever_str_match.group(1) + b"'",
+                b"'FileVersion', u'" + string_repl + b"'",
+            )
+            .replace(
+                b"'ProductVersion', u'" + prodver_str_match.group(1) + b"'",
+                b"'ProductVersion', u'" + string_repl + b"'",
+            )
         )
 
-        # Update FileVersion and ProductVersion strings (3 components)
-        content = re.sub(
-            r"StringStruct\(u\'FileVersion\',\s*u\'[\d\.]+\'\)",
-            f"StringStruct(u'FileVersion', u'{version_string}')",
-            content,
-        )
-        content = re.sub(
-            r"StringStruct\(u\'ProductVersion\',\s*u\'[\d\.]+\'\)",
-            f"StringStruct(u'ProductVersion', u'{version_string}')",
-            content,
-        )
+    if new_content is None:
+        # Fallback: replace all four fields in one alternation pass
+        def _replace(match):
+            if match.group(1):
+                return match.group(1) + b"=" + tuple_repl
+            return (
+                b"StringStruct(u'" + match.group(2) + b"', u'" + string_repl + b"')"
+            )
 
-        # Write the updated content back to the file
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(content)
+        new_content = _VERSION_INFO_RE.sub(_replace, content)
 
+    # Nothing changed (version already current): skip the write so
+    # the mtime stays put and CI re-runs see no spurious diff
+    if new_content == content:
         return True
 
-    except Exception as e:
+    # Write the updated content back to the file
+    try:
+        Path(file_path).write_bytes(new_content)
+    except OSError as e:
         print(f"Error updating version: {e}", file=sys.stderr)
         return False
 
+    return True
+
 
 def update_iss_version(file_path, new_version):
     """
@@ -108,26 +162,33 @@ def update_iss_version(file_path, new_version):
     """
     try:
         # Read the current content
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
-
-        # Update the version definition
-        content = re.sub(
-            r'#define MyAppVersion "[\d\.]+"',
-            f'#define MyAppVersion "{new_version}"',
-            content,
-        )
+        content = Path(file_path).read_bytes()
+    except OSError as e:
+        print(f"Error updating ISS version: {e}", file=sys.stderr)
+        return False
+
+    # Cheap substring prefilter: no version define, nothing to do
+    if b"MyAppVersion" not in content:
+        return True
 
-        # Write the updated content back to the file
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(content)
+    # Update the version definition. A callable replacement skips
+    # re's backreference-template parsing on each match.
+    repl = f'#define MyAppVersion "{new_version}"'.encode()
+    new_content = _ISS_VERSION_RE.sub(lambda _m: repl, content)
 
+    # Skip the write when the version is already current
+    if new_content == content:
         return True
 
-    except Exception as e:
+    # Write the updated content back to the file
+    try:
+        Path(file_path).write_bytes(new_content)
+    except OSError as e:
         print(f"Error updating ISS version: {e}", file=sys.stderr)
         return False
 
+    return True
+
 
 def update_config_version(file_path, new_version):
     """
@@ -142,26 +203,33 @@ def update_config_version(file_path, new_version):
     """
     try:
         # Read the current content
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
-
-        # Update the version definition
-        content = re.sub(
-            r'APP_VERSION = "[\d\.]+"',
-            f'APP_VERSION = "{new_version}"',
-            content,
-        )
+        content = Path(file_path).read_bytes()
+    except OSError as e:
+        print(f"Error updating config version: {e}", file=sys.stderr)
+        return False
+
+    # Cheap substring prefilter: no version assignment, nothing to do
+    if b"APP_VERSION" not in content:
+        return True
 
-        # Write the updated content back to the file
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(content)
+    # Update the version definition. A callable replacement skips
+    # re's backreference-template parsing on each match.
+    repl = f'APP_VERSION = "{new_version}"'.encode()
+    new_content = _CONFIG_VERSION_RE.sub(lambda _m: repl, content)
 
+    # Skip the write when the version is already current
+    if new_content == content:
         return True
 
-    except Exception as e:
+    # Write the updated content back to the file
+    try:
+        Path(file_path).write_bytes(new_content)
+    except OSError as e:
         print(f"Error updating config version: {e}", file=sys.stderr)
         return False
 
+    return True
+
 
 def main():
     """Main entry point for the script."""
@@ -192,6 +260,18 @@ def main():
 
     args = parser.parse_args()
 
+    # Parse and validate the version once, before any file is opened;
+    # the parsed values are shared by the dry-run and real paths
+    try:
+        version_tuple = parse_version(args.version)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    if args.version.count(".") == 2:
+        version_string = args.version
+    else:
+        version_string = format_version_string(version_tuple)
+
     version_file_path = Path(args.version_file)
     iss_file_path = Path(args.iss_file)
     config_file_path = Path(args.config_file)
@@ -215,10 +295,6 @@ def main():
         return 1
 
     if args.dry_run:
-        # Parse the new version
-        version_tuple = parse_version(args.version)
-        version_string = format_version_string(version_tuple)
-
         print(f"Would update version to: {args.version}")
         print(f"  - File version tuple: {version_tuple}")
         print(f"  - Version string: {version_string}")
@@ -227,7 +303,9 @@ def main():
         print(f"  - Would update version in: {config_file_path}")
         return 0
 
-    success_version = update_version_info(version_file_path, args.version)
+    success_version = update_version_info(
+        version_file_path, version_tuple, version_string
+    )
     success_iss = update_iss_version(iss_file_path, args.version)
     success_config = update_config_version(config_file_path, args.version)
 